@@ -735,6 +735,22 @@ class MCPToolKit:
             "properties": properties
         })
 
+    def excel_add_formats(self, filename: str, formats: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Create several cell formats at once.
+
+        Args:
+            filename: Path to the Excel file.
+            formats: Dictionary mapping format names to format properties.
+
+        Returns:
+            JSON string containing the result.
+        """
+        return self.client.call_tool("xlsx_add_formats", {
+            "filename": filename,
+            "formats": formats
+        })
+
     def excel_add_chart(self, filename: str, worksheet: str, chart_type: str,
                         data_range: List[Dict[str, Any]], position: Dict[str, int],
                         options: Optional[Dict[str, Any]] = None) -> str:
@@ -886,7 +902,8 @@ class MCPToolKit:
     def excel_read_excel(self, filename: str, sheet_name: Union[str, int] = 0,
                          output_id: Optional[str] = None, header: Union[int, List[int], None] = 0,
                          names: Optional[List[str]] = None,
-                         skiprows: Union[int, List[int], None] = None) -> str:
+                         skiprows: Union[int, List[int], None] = None,
+                         downcast: bool = False, categorize: bool = False) -> str:
         """
         Read an Excel file into a pandas DataFrame.
 
@@ -897,6 +914,8 @@ class MCPToolKit:
             header: Row(s) to use as column names (default: 0).
             names: List of custom column names (default: None).
             skiprows: Row indices to skip or number of rows to skip (default: None).
+            downcast: Store numeric columns in the narrowest lossless dtype (default: False).
+            categorize: Store repetitive string columns as categoricals (default: False).
 
         Returns:
             JSON string with DataFrame information.
@@ -904,7 +923,9 @@ class MCPToolKit:
         params = {
             "filename": filename,
             "sheet_name": sheet_name,
-            "header": header
+            "header": header,
+            "downcast": downcast,
+            "categorize": categorize
         }
 
         if output_id:
@@ -920,7 +941,9 @@ class MCPToolKit:
                        delimiter: str = ",", header: Union[int, List[int], None] = 0,
                        names: Optional[List[str]] = None,
                        skiprows: Union[int, List[int], None] = None,
-                       encoding: Optional[str] = None) -> str:
+                       encoding: Optional[str] = None,
+                       chunksize: Optional[int] = None,
+                       downcast: bool = False, categorize: bool = False) -> str:
         """
         Read a CSV file into a pandas DataFrame.
 
@@ -932,6 +955,10 @@ class MCPToolKit:
             names: List of custom column names (default: None).
             skiprows: Row indices to skip or number of rows to skip (default: None).
             encoding: File encoding (default: None, pandas will try to detect).
+            chunksize: Read in chunks of this many rows, each stored on disk
+                under output_id_<n>; requires pyarrow (default: None).
+            downcast: Store numeric columns in the narrowest lossless dtype (default: False).
+            categorize: Store repetitive string columns as categoricals (default: False).
 
         Returns:
             JSON string with DataFrame information.
@@ -939,7 +966,9 @@ class MCPToolKit:
         params = {
             "filename": filename,
             "delimiter": delimiter,
-            "header": header
+            "header": header,
+            "downcast": downcast,
+            "categorize": categorize
         }
 
         if output_id:
@@ -950,6 +979,8 @@ class MCPToolKit:
             params["skiprows"] = skiprows
         if encoding:
             params["encoding"] = encoding
+        if chunksize:
+            params["chunksize"] = chunksize
 
         return self.client.call_tool("xlsx_read_csv", params)
 
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 import os
+import time
+import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
@@ -30,6 +33,21 @@ class BraveSearchService:
         "month": 0,
         "last_reset": datetime.now().timestamp()
     })
+    # Recent search results are reused for cache_ttl seconds, keeping at
+    # most cache_size of them
+    cache_ttl: float = 300
+    cache_size: int = 128
+    # Request headers, built once from the API key
+    headers: dict = field(init=False, repr=False)
+    # (time, result) per search, least recently used first
+    result_cache: OrderedDict = field(default_factory=OrderedDict, init=False, repr=False)
+
+    def __post_init__(self):
+        self.headers = {
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+            "X-Subscription-Token": self.api_key
+        }
 
     def check_rate_limit(self):
         """Check if we've hit the rate limit"""
@@ -46,8 +64,38 @@ class BraveSearchService:
         self.request_count["second"] += 1
         self.request_count["month"] += 1
 
+    async def _cached(self, key, search):
+        """Return a recent result for the same search, or run it and remember it"""
+        now = time.monotonic()
+        hit = self.result_cache.get(key)
+        if hit is not None and now - hit[0] < self.cache_ttl:
+            self.result_cache.move_to_end(key)
+            return hit[1]
+
+        result = await search()
+
+        # API errors are not cached so the next call tries again
+        if not result.startswith("Brave API error"):
+            self.result_cache[key] = (now, result)
+            self.result_cache.move_to_end(key)
+            while len(self.result_cache) > self.cache_size:
+                self.result_cache.popitem(last=False)
+        return result
+
     async def perform_web_search(self, query: str, count: int = 10, offset: int = 0) -> str:
         """Execute a web search using Brave Search API"""
+        return await self._cached(
+            ("web", query, count, offset),
+            lambda: self._web_search(query, count, offset))
+
+    async def perform_local_search(self, query: str, count: int = 5) -> str:
+        """Execute a local search using Brave Search API"""
+        return await self._cached(
+            ("local", query, count),
+            lambda: self._local_search(query, count))
+
+    async def _web_search(self, query, count, offset):
+        """Run a web search request"""
         import httpx
 
         self.check_rate_limit()
@@ -59,14 +107,8 @@ class BraveSearchService:
             "offset": offset
         }
 
-        headers = {
-            "Accept": "application/json",
-            "Accept-Encoding": "gzip",
-            "X-Subscription-Token": self.api_key
-        }
-
         async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
+            response = await client.get(url, params=params, headers=self.headers)
 
             if not response.is_success:
                 return f"Brave API error: {response.status_code} {response.reason_phrase}\n{response.text}"
@@ -91,8 +133,8 @@ class BraveSearchService:
 
             return "\n\n".join(formatted_results)
 
-    async def perform_local_search(self, query: str, count: int = 5) -> str:
-        """Execute a local search using Brave Search API"""
+    async def _local_search(self, query, count):
+        """Run a local search request, falling back to web search"""
         import httpx
 
         self.check_rate_limit()
@@ -105,14 +147,8 @@ class BraveSearchService:
             "count": min(count, 20)
         }
 
-        headers = {
-            "Accept": "application/json",
-            "Accept-Encoding": "gzip",
-            "X-Subscription-Token": self.api_key
-        }
-
         async with httpx.AsyncClient() as client:
-            web_response = await client.get(url, params=params, headers=headers)
+            web_response = await client.get(url, params=params, headers=self.headers)
 
             if not web_response.is_success:
                 return f"Brave API error: {web_response.status_code} {web_response.reason_phrase}\n{web_response.text}"
@@ -127,9 +163,11 @@ class BraveSearchService:
             if not location_ids:
                 return await self.perform_web_search(query, count)
 
-            # Get POI details and descriptions
-            pois_data = await self._get_pois_data(location_ids, client, headers)
-            descriptions_data = await self._get_descriptions_data(location_ids, client, headers)
+            # POI details and descriptions are independent, so fetch them concurrently
+            pois_data, descriptions_data = await asyncio.gather(
+                self._get_pois_data(location_ids, client, self.headers),
+                self._get_descriptions_data(location_ids, client, self.headers)
+            )
 
             return self._format_local_results(pois_data, descriptions_data)
 
@@ -1,15 +1,31 @@
 #!/usr/bin/env python3
 import os
 import json
+import atexit
+import shutil
+import tempfile
+import uuid
 import logging
 import io
+import functools
+import importlib.util
+import operator
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import List, Dict, Optional, Any, Union, Tuple
-import pandas as pd
 
 # Ensure compatibility with mcp server
 from mcp.server.fastmcp import FastMCP, Context
 
+from app.tools.json_utils import to_json
+
+# orjson is optional but encodes tool responses several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # External MCP reference for tool registration
 external_mcp = None
 
@@ -29,6 +45,7 @@ class XlsxWriterTools(str, Enum):
     WRITE_DATA = "xlsx_write_data"
     WRITE_MATRIX = "xlsx_write_matrix"
     ADD_FORMAT = "xlsx_add_format"
+    ADD_FORMATS = "xlsx_add_formats"
     ADD_CHART = "xlsx_add_chart"
     ADD_IMAGE = "xlsx_add_image"
     ADD_FORMULA = "xlsx_add_formula"
@@ -52,30 +69,248 @@ class XlsxWriterTools(str, Enum):
     DATAFRAME_TO_CSV = "xlsx_dataframe_to_csv"
 
 
-# Storage for DataFrames in memory
-_dataframes = {}
+# Metadata for every stored DataFrame: id -> {"shape", "columns", "path"}
+_dataframe_registry = {}
+
+# Live DataFrames: small ones stay here permanently, large ones spilled to
+# disk are kept only while recently used
+_dataframes = OrderedDict()
+
+# Number of spilled DataFrames kept live after their last access
+HOT_DATAFRAMES = 4
+
+# Comparison operators accepted by filter_dataframe's column/value mode
+_COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le
+}
+
+# pandas aggregation names with an Arrow hash aggregate equivalent, mapped to
+# (Arrow function, ddof for variance-style functions)
+_ARROW_AGGREGATIONS = {
+    "sum": ("sum", None),
+    "mean": ("mean", None),
+    "min": ("min", None),
+    "max": ("max", None),
+    "count": ("count", None),
+    "nunique": ("count_distinct", None),
+    "std": ("stddev", 1),
+    "var": ("variance", 1)
+}
+
+# Frames above this many cells are treated as large when exporting and
+# are spilled to memory-mapped Feather files when pyarrow is available
+LARGE_FRAME_CELLS = 200_000
+
+# String columns of frames with at least this many rows are stored as
+# categoricals when fewer than half of their values are distinct
+CATEGORY_MIN_ROWS = 1_000
+
+# Files above this size are memory-mapped rather than read through buffers
+MMAP_READ_BYTES = 16 << 20
+
+# The strings pandas.read_csv reads as NaN by default
+_PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null"
+]
+
+# Directory for spilled DataFrames, created on first spill
+_cache_dir = None
+
+# dataframe_info results per stored DataFrame, reset whenever the id is reused
+_info_cache = {}
+
+# Correlation and describe results per stored DataFrame, keyed by their
+# arguments and dropped whenever the id is reused or cleared
+_stats_cache = {}
+
+# Sheet names per workbook path, with the (mtime, size) they were read at
+_sheet_name_cache = {}
+
+
+# Tool responses are indented JSON
+_to_json = functools.partial(to_json, indent=True)
+
+
+def _get_cache_dir():
+    """Get the directory used for spilled DataFrames"""
+    global _cache_dir
+    if _cache_dir is None:
+        _cache_dir = os.environ.get("XLSX_DATAFRAME_CACHE_DIR")
+        if _cache_dir:
+            os.makedirs(_cache_dir, exist_ok=True)
+        else:
+            _cache_dir = tempfile.mkdtemp(prefix="mcp_xlsx_")
+            atexit.register(shutil.rmtree, _cache_dir, True)
+    return _cache_dir
+
+
+def _spill_dataframe(df, force=False):
+    """Write a large DataFrame to an uncompressed Feather file
+
+    With force, frames of any size are written. Returns the file path, or
+    None if the frame stays in memory.
+    """
+    if not force and df.shape[0] * df.shape[1] <= LARGE_FRAME_CELLS:
+        return None
+
+    pa = _get_xlsx_service().pyarrow
+    if pa is None:
+        return None
+
+    try:
+        import pyarrow.feather
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowException, TypeError, ValueError):
+        # Mixed-type object columns have no Arrow equivalent
+        return None
+
+    path = os.path.join(_get_cache_dir(), f"{uuid.uuid4().hex}.arrow")
+    pyarrow.feather.write_feather(table, path, compression="uncompressed")
+    return path
+
+
+def _load_dataframe(path):
+    """Read a spilled DataFrame back through a memory map"""
+    import pyarrow.feather
+    table = pyarrow.feather.read_table(path, memory_map=True)
+    return table.to_pandas(use_threads=True)
+
+
+def _remove_spill_file(dataframe_id):
+    """Delete the spill file of a stored DataFrame, if it has one"""
+    entry = _dataframe_registry.get(dataframe_id)
+    if entry and entry["path"]:
+        try:
+            os.remove(entry["path"])
+        except OSError:
+            pass
+
+
+def _consolidate_dataframe(df):
+    """Merge a fragmented DataFrame's blocks so each dtype sits in one contiguous array"""
+    # Frames built column by column (assignments, concat)
+    # carry one block per column; a deep copy consolidates them.
+    # The block manager is private, so store the frame as is if it changes
+    try:
+        consolidated = df._mgr.is_consolidated()
+    except AttributeError:
+        return df
+    return df if consolidated else df.copy()
+
+
+def _categorize_dataframe(df):
+    """Dictionary-encode repetitive string columns as categoricals
+
+    Returns a new frame when any column is encoded; the input is not modified.
+    """
+    if len(df) < CATEGORY_MIN_ROWS:
+        return df
+
+    import pandas as pd
+
+    encoded = {}
+    for column in df.columns:
+        series = df[column]
+        if not (series.dtype == object or isinstance(series.dtype, pd.StringDtype)):
+            continue
+        try:
+            if series.nunique() * 2 < len(series):
+                encoded[column] = "category"
+        except TypeError:
+            # Unhashable or unorderable values can't be categories
+            continue
+    return df.astype(encoded) if encoded else df
+
+
+def _store_dataframe(dataframe_id, df, categorize=False, spill=False):
+    """Store DataFrame for future operations
 
+    With categorize, repetitive string columns are stored as categoricals.
+    With spill, the frame is written to disk whatever its size, so it is
+    evicted like any large frame once it is no longer recently used.
+    """
+    if categorize:
+        df = _categorize_dataframe(df)
+    df = _consolidate_dataframe(df)
+    _info_cache.pop(dataframe_id, None)
+    _stats_cache.pop(dataframe_id, None)
+    _remove_spill_file(dataframe_id)
+    path = _spill_dataframe(df, force=spill)
+    _dataframe_registry[dataframe_id] = {
+        "shape": df.shape,
+        "columns": list(df.columns),
+        "path": path
+    }
 
-def _store_dataframe(dataframe_id, df):
-    """Store DataFrame in memory for future operations"""
+    # The new frame is likely to be used next, so keep it live either way
     _dataframes[dataframe_id] = df
+    _dataframes.move_to_end(dataframe_id)
+    _evict_dataframes()
     return dataframe_id
 
 
+def _evict_dataframes():
+    """Drop the least recently used spilled DataFrames from memory"""
+    spilled_live = [df_id for df_id in _dataframes
+                    if _dataframe_registry[df_id]["path"]]
+    for df_id in spilled_live[:-HOT_DATAFRAMES or None]:
+        del _dataframes[df_id]
+
+
 def _get_dataframe(dataframe_id):
-    """Retrieve DataFrame from memory"""
-    return _dataframes.get(dataframe_id)
+    """Retrieve a stored DataFrame, loading it from disk if it was spilled"""
+    df = _dataframes.get(dataframe_id)
+    if df is not None:
+        _dataframes.move_to_end(dataframe_id)
+        return df
+
+    entry = _dataframe_registry.get(dataframe_id)
+    if entry is None:
+        return None
+
+    df = _load_dataframe(entry["path"])
+    _dataframes[dataframe_id] = df
+    _evict_dataframes()
+    return df
+
+
+def _get_dataframe_info(xlsx, dataframe_id, df=None):
+    """Get dataframe_info for a stored DataFrame, computing it once per store"""
+    info = _info_cache.get(dataframe_id)
+    if info is None:
+        if df is None:
+            df = _get_dataframe(dataframe_id)
+        info = xlsx.dataframe_info(df)
+        if "error" not in info:
+            _info_cache[dataframe_id] = info
+    return info
+
+
+def _get_dataframe_metadata(dataframe_id):
+    """Get the shape and columns of a stored DataFrame without loading it"""
+    return _dataframe_registry.get(dataframe_id)
 
 
 def _list_dataframes():
-    """List all available DataFrames in memory"""
-    return list(_dataframes.keys())
+    """List all stored DataFrames"""
+    return list(_dataframe_registry.keys())
 
 
 def _clear_dataframe(dataframe_id):
-    """Remove DataFrame from memory"""
-    if dataframe_id in _dataframes:
-        del _dataframes[dataframe_id]
+    """Remove a stored DataFrame from memory and disk"""
+    if dataframe_id in _dataframe_registry:
+        _info_cache.pop(dataframe_id, None)
+        _stats_cache.pop(dataframe_id, None)
+        _remove_spill_file(dataframe_id)
+        del _dataframe_registry[dataframe_id]
+        _dataframes.pop(dataframe_id, None)
         return True
     return False
 
@@ -85,45 +320,103 @@ class XlsxWriterService:
 
     def __init__(self):
         """Initialize the XlsxWriter service"""
+        # Dictionary to store active workbooks and worksheets
+        self.workbooks = {}
+
+        # Hashed lookup indexes for repeated 'in' filters, keyed by value tuple
+        self._isin_cache = OrderedDict()
+
+    # Libraries are imported on first use so a workbook-only workflow never
+    # pays for importing pandas, and vice versa. A failed import is cached
+    # as None so it is only attempted once.
+
+    @functools.cached_property
+    def xlsxwriter(self):
+        """The xlsxwriter module, or None if it is not installed"""
         try:
             import xlsxwriter
-            self.xlsxwriter = xlsxwriter
-            self.initialized = True
+            return xlsxwriter
         except ImportError:
             logging.error(
                 "xlsxwriter library not installed. Please install with 'pip install XlsxWriter'")
-            self.initialized = False
-            self.xlsxwriter = None
+            return None
 
-        # Dictionary to store active workbooks and worksheets
-        self.workbooks = {}
-
-        # Check for pandas, openpyxl, and xlrd (for reading Excel)
+    @functools.cached_property
+    def pandas(self):
+        """The pandas module, or None if it is not installed"""
         try:
-            import pandas as pd
-            self.pandas = pd
-            self.pandas_available = True
+            import pandas
+            return pandas
         except ImportError:
             logging.error(
                 "pandas library not installed. Please install with 'pip install pandas'")
-            self.pandas_available = False
-            self.pandas = None
+            return None
 
+    @functools.cached_property
+    def openpyxl(self):
+        """The openpyxl module, or None if it is not installed"""
         try:
             import openpyxl
-            self.openpyxl_available = True
+            return openpyxl
         except ImportError:
             logging.warning(
                 "openpyxl library not installed. Some Excel reading features may be limited. Install with 'pip install openpyxl'")
-            self.openpyxl_available = False
+            return None
 
+    @functools.cached_property
+    def xlrd(self):
+        """The xlrd module, or None if it is not installed"""
         try:
             import xlrd
-            self.xlrd_available = True
+            return xlrd
         except ImportError:
             logging.warning(
                 "xlrd library not installed. Reading older Excel formats may be limited. Install with 'pip install xlrd'")
-            self.xlrd_available = False
+            return None
+
+    @functools.cached_property
+    def pyarrow(self):
+        """The pyarrow module with pyarrow.compute loaded, or None if it is not installed"""
+        try:
+            import pyarrow
+            import pyarrow.compute
+            return pyarrow
+        except ImportError:
+            return None
+
+    @functools.cached_property
+    def calamine_available(self):
+        """Whether python-calamine is installed for Rust-based Excel parsing"""
+        return importlib.util.find_spec("python_calamine") is not None
+
+    @functools.cached_property
+    def numexpr_available(self):
+        """Whether numexpr is installed to speed up DataFrame.query()"""
+        try:
+            import numexpr
+        except ImportError:
+            return False
+
+        # Use every core for query evaluation, within numexpr's own limit
+        numexpr.set_num_threads(
+            min(os.cpu_count() or 1, numexpr.MAX_THREADS))
+        return True
+
+    @property
+    def initialized(self):
+        return self.xlsxwriter is not None
+
+    @property
+    def pandas_available(self):
+        return self.pandas is not None
+
+    @property
+    def openpyxl_available(self):
+        return self.openpyxl is not None
+
+    @property
+    def xlrd_available(self):
+        return self.xlrd is not None
 
     def _is_initialized(self):
         """Check if the service is properly initialized"""
@@ -152,6 +445,7 @@ class XlsxWriterService:
                 "workbook": workbook,
                 "worksheets": {},
                 "formats": {},
+                "format_specs": {},
                 "charts": {}
             }
 
@@ -272,6 +566,69 @@ class XlsxWriterService:
         except Exception as e:
             return {"error": f"Error adding format: {str(e)}"}
 
+    async def add_formats(self, filename, formats):
+        """Create several cell formats in one pass"""
+        try:
+            self._is_initialized()
+
+            # Check if workbook exists
+            if filename not in self.workbooks:
+                return {"error": f"Workbook {filename} not found"}
+
+            workbook = self.workbooks[filename]["workbook"]
+            format_specs = self.workbooks[filename]["format_specs"]
+
+            # Build detached formats first so a bad spec fails before the
+            # workbook or its caches are touched
+            for format_name, format_props in formats.items():
+                try:
+                    self.xlsxwriter.format.Format(format_props)
+                except Exception as e:
+                    return {"error": f"Invalid format '{format_name}': {str(e)}"}
+
+            # Identical property sets share a single Format object
+            created = {}
+            for format_name, format_props in formats.items():
+                try:
+                    spec_key = frozenset(format_props.items())
+                except TypeError:
+                    spec_key = None
+
+                format_obj = format_specs.get(spec_key) if spec_key else None
+                if format_obj is None:
+                    format_obj = workbook.add_format(format_props)
+                    if spec_key:
+                        format_specs[spec_key] = format_obj
+                created[format_name] = format_obj
+
+            self.workbooks[filename]["formats"].update(created)
+
+            return {"filename": filename, "formats": list(created.keys()), "status": "added"}
+        except Exception as e:
+            return {"error": f"Error adding formats: {str(e)}"}
+
+    def _series_from_dataframe(self, df, worksheet_name, start_row=0, start_col=0):
+        """Build chart series for a DataFrame written with its header at start_row
+
+        The first column provides the categories and every other column
+        becomes a series. References use xlsxwriter's list form so no range
+        strings need to be built or parsed.
+        """
+        first_row = start_row + 1
+        last_row = start_row + len(df)
+        categories = [worksheet_name, first_row,
+                      start_col, last_row, start_col]
+
+        series = []
+        for offset in range(1, len(df.columns)):
+            col = start_col + offset
+            series.append({
+                'name': [worksheet_name, start_row, col],
+                'categories': categories,
+                'values': [worksheet_name, first_row, col, last_row, col]
+            })
+        return series
+
     async def add_chart(self, filename, worksheet_name, chart_type, data_range, position, options=None):
         """Add a chart to a worksheet"""
         try:
@@ -291,8 +648,23 @@ class XlsxWriterService:
             # Create the chart
             chart = workbook.add_chart({'type': chart_type})
 
+            # A DataFrame laid out from A1 becomes one series per value column
+            if hasattr(data_range, 'columns'):
+                data_range = self._series_from_dataframe(
+                    data_range, worksheet_name)
+
+            # Grouped charts usually share one x-axis; reuse a single
+            # categories reference instead of one per series
+            shared_cats = None
+            if data_range and all('categories' in series for series in data_range):
+                first_cats = data_range[0]['categories']
+                if all(series['categories'] == first_cats for series in data_range):
+                    shared_cats = first_cats
+
             # Add the data series
             for series in data_range:
+                if shared_cats is not None:
+                    series = dict(series, categories=shared_cats)
                 chart.add_series(series)
 
             # Set chart title and other options if provided
@@ -420,6 +792,20 @@ class XlsxWriterService:
     # New methods for reading Excel and CSV files
     #
 
+    def _read_excel_sheets(self, filename, sheet_names, engine=None, **kwargs):
+        """Read several sheets of one workbook in parallel threads"""
+        with self.pandas.ExcelFile(filename, engine=engine) as excel_file:
+            if sheet_names is None:
+                sheet_names = excel_file.sheet_names
+
+            max_workers = min(len(sheet_names), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+                frames = executor.map(
+                    lambda sheet: excel_file.parse(sheet, **kwargs), sheet_names)
+                dataframes = dict(zip(sheet_names, frames))
+
+        return {"sheets": list(dataframes.keys()), "dataframes": dataframes}
+
     async def read_excel(self, filename, sheet_name=0, **kwargs):
         """Read Excel file into DataFrame"""
         try:
@@ -429,6 +815,14 @@ class XlsxWriterService:
             if not os.path.exists(filename):
                 return {"error": f"File {filename} not found"}
 
+            # calamine parses XML in Rust, many times faster than openpyxl
+            if self.calamine_available:
+                kwargs.setdefault("engine", "calamine")
+
+            # Multiple sheets are parsed concurrently from one shared handle
+            if sheet_name is None or (isinstance(sheet_name, list) and len(sheet_name) > 1):
+                return self._read_excel_sheets(filename, sheet_name, **kwargs)
+
             # Read Excel file
             df = self.pandas.read_excel(
                 filename, sheet_name=sheet_name, **kwargs)
@@ -441,6 +835,124 @@ class XlsxWriterService:
         except Exception as e:
             return {"error": f"Error reading Excel file: {str(e)}"}
 
+    def _downcast_numeric(self, df):
+        """Shrink numeric columns to the narrowest dtype that holds their values exactly
+
+        Returns the DataFrame and a {column: {"original", "stored"}} map of the
+        columns that changed.
+        """
+        import numpy as np
+
+        types = self.pandas.api.types
+        dtype_map = {}
+        for column in df.columns:
+            series = df[column]
+            dtype = series.dtype
+            if types.is_extension_array_dtype(dtype) or types.is_bool_dtype(dtype):
+                continue
+
+            if types.is_integer_dtype(dtype):
+                downcast = self.pandas.to_numeric(series, downcast="integer")
+            elif types.is_float_dtype(dtype):
+                downcast = self.pandas.to_numeric(series, downcast="float")
+                # float32 keeps the range but not always the precision
+                if not np.array_equal(downcast.to_numpy(dtype=dtype), series.to_numpy(),
+                                      equal_nan=True):
+                    continue
+            else:
+                continue
+
+            if downcast.dtype != dtype:
+                df[column] = downcast
+                dtype_map[str(column)] = {"original": str(dtype), "stored": str(downcast.dtype)}
+
+        return df, dtype_map
+
+    def _read_csv_arrow(self, filename, delimiter=",", header="infer", names=None,
+                        skiprows=None, encoding=None, **kwargs):
+        """Read a CSV file with pyarrow.csv, matching pandas.read_csv defaults
+
+        Returns None when pyarrow is unavailable or the options need pandas.
+        """
+        pa = self.pyarrow
+        if header == "infer":
+            header = None if names else 0
+        if pa is None or kwargs or header not in (0, None):
+            return None
+        if skiprows is not None and not isinstance(skiprows, int):
+            return None
+
+        import pyarrow.csv
+
+        skip_rows = skiprows or 0
+        # With header=0 the header line is consumed even when names replace it
+        if header == 0 and names:
+            skip_rows += 1
+
+        read_options = pyarrow.csv.ReadOptions(
+            use_threads=True,
+            block_size=32 << 20,
+            skip_rows=skip_rows,
+            column_names=names,
+            autogenerate_column_names=header is None and not names,
+            encoding=encoding or "utf8"
+        )
+        parse_options = pyarrow.csv.ParseOptions(delimiter=delimiter)
+
+        def read(column_types=None):
+            # pandas leaves date-like text as strings and reads its NA markers
+            # as NaN. A format that never matches switches off timestamp inference.
+            convert_options = pyarrow.csv.ConvertOptions(
+                timestamp_parsers=["%Y\x01"], null_values=_PANDAS_NA_VALUES,
+                strings_can_be_null=True, column_types=column_types)
+            # Large files are memory-mapped so blocks are parsed straight from
+            # the page cache instead of being copied into read buffers first
+            if os.path.getsize(filename) > MMAP_READ_BYTES:
+                with pa.memory_map(filename, "r") as source:
+                    return pyarrow.csv.read_csv(
+                        source, read_options=read_options,
+                        parse_options=parse_options, convert_options=convert_options)
+            return pyarrow.csv.read_csv(
+                filename, read_options=read_options,
+                parse_options=parse_options, convert_options=convert_options)
+
+        try:
+            table = read()
+
+            # pandas renames repeated headers to a, a.1, ...; leave that to it
+            if len(set(table.column_names)) != len(table.column_names):
+                return None
+
+            # Integers beyond int64 become lossy doubles in Arrow where pandas
+            # keeps them as uint64, so let pandas read those files
+            for column in table.itercolumns():
+                if pa.types.is_floating(column.type):
+                    largest = pa.compute.max(pa.compute.abs(column)).as_py()
+                    if largest is not None and largest >= 2 ** 63:
+                        return None
+
+            # Arrow parses HH:MM[:SS] text as times, which pandas keeps as
+            # text; re-read those columns as strings to preserve the exact text
+            time_columns = {field.name: pa.string() for field in table.schema
+                            if pa.types.is_time(field.type)}
+            if time_columns:
+                table = read(time_columns)
+        except (pa.ArrowException, ValueError) as e:
+            logging.debug("pyarrow could not read %s, using pandas: %s", filename, e)
+            return None
+
+        # Arrow still infers plain dates, which pandas keeps as text
+        for i, field in enumerate(table.schema):
+            if pa.types.is_date(field.type):
+                table = table.set_column(
+                    i, field.name, table.column(i).cast(pa.string()))
+
+        df = table.to_pandas(self_destruct=True, use_threads=True)
+        if header is None and not names:
+            # pandas numbers generated columns from 0
+            df.columns = range(len(df.columns))
+        return df
+
     async def read_csv(self, filename, **kwargs):
         """Read CSV file into DataFrame"""
         try:
@@ -450,12 +962,29 @@ class XlsxWriterService:
             if not os.path.exists(filename):
                 return {"error": f"File {filename} not found"}
 
-            # Read CSV file
-            df = self.pandas.read_csv(filename, **kwargs)
+            # Prefer pyarrow's multithreaded block reader, falling back to
+            # pandas for options it can't express or files it can't parse
+            df = self._read_csv_arrow(filename, **kwargs)
+            if df is None:
+                df = self.pandas.read_csv(filename, **kwargs)
             return df
         except Exception as e:
             return {"error": f"Error reading CSV file: {str(e)}"}
 
+    async def read_csv_chunks(self, filename, chunksize, **kwargs):
+        """Open a CSV file for reading in DataFrame chunks of chunksize rows"""
+        try:
+            self._check_pandas_available()
+
+            # Check if file exists
+            if not os.path.exists(filename):
+                return {"error": f"File {filename} not found"}
+
+            # Returns an iterator, so only one chunk is parsed at a time
+            return self.pandas.read_csv(filename, chunksize=chunksize, **kwargs)
+        except Exception as e:
+            return {"error": f"Error reading CSV file: {str(e)}"}
+
     async def get_excel_sheet_names(self, filename):
         """Get sheet names from Excel file"""
         try:
@@ -465,15 +994,43 @@ class XlsxWriterService:
             if not os.path.exists(filename):
                 return {"error": f"File {filename} not found"}
 
-            # Get sheet names
-            excel_file = self.pandas.ExcelFile(filename)
-            sheet_names = excel_file.sheet_names
+            # Reuse the names read last time unless the file has changed since
+            path = os.path.abspath(filename)
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = _sheet_name_cache.get(path)
+            if cached is not None and cached[0] == signature:
+                return list(cached[1])
+
+            # calamine reads sheet names from the workbook header only
+            if self.calamine_available:
+                from python_calamine import CalamineWorkbook
+                sheet_names = CalamineWorkbook.from_path(filename).sheet_names
+            else:
+                with self.pandas.ExcelFile(filename) as excel_file:
+                    sheet_names = excel_file.sheet_names
 
+            _sheet_name_cache[path] = (signature, list(sheet_names))
             return sheet_names
         except Exception as e:
             return {"error": f"Error getting sheet names: {str(e)}"}
 
-    async def dataframe_info(self, df):
+    def _memory_usage(self, df):
+        """Get total DataFrame memory usage, cached on the DataFrame itself"""
+        # attrs are copied onto derived DataFrames, so the cache is keyed by
+        # identity to avoid reporting a parent's size for a filtered copy
+        cached = df.attrs.get("_memusage")
+        if cached and cached[0] == id(df):
+            return cached[1]
+
+        # Only object columns need the deep scan; numeric, categorical and
+        # Arrow-backed columns already report their exact size without it
+        deep = any(dtype == object for dtype in df.dtypes)
+        usage = int(df.memory_usage(deep=deep).sum())
+        df.attrs["_memusage"] = (id(df), usage)
+        return usage
+
+    def dataframe_info(self, df):
         """Get information about DataFrame"""
         try:
             self._check_pandas_available()
@@ -487,6 +1044,9 @@ class XlsxWriterService:
             df.info(buf=buffer)
             info_output = buffer.getvalue()
 
+            # One null scan serves both the per-column counts and has_nulls
+            null_counts = df.isna().sum()
+
             # Basic info about the DataFrame
             result = {
                 "shape": df.shape,
@@ -494,14 +1054,14 @@ class XlsxWriterService:
                 # Convert to strings for JSON serialization
                 "dtypes": {str(k): str(v) for k, v in df.dtypes.to_dict().items()},
                 "info": info_output,
-                "memory_usage": df.memory_usage(deep=True).sum(),
-                "has_nulls": df.isnull().any().any()
+                "memory_usage": self._memory_usage(df),
+                "has_nulls": bool(null_counts.any()),
+                "null_counts": {str(k): int(v) for k, v in null_counts.items()}
             }
 
             # Add sample data (first 5 rows)
             try:
-                result["head"] = json.loads(
-                    df.head().to_json(orient="records"))
+                result["head"] = self._compact_head(df)
             except:
                 # Fallback if to_json fails for some reason
                 result["head"] = str(df.head())
@@ -510,6 +1070,131 @@ class XlsxWriterService:
         except Exception as e:
             return {"error": f"Error getting DataFrame info: {str(e)}"}
 
+    def _compact_head(self, df, n=5):
+        """First n rows as {"columns", "rows"}, without repeating column names per row"""
+        head_json = df.head(n).to_json(orient="split", index=False)
+        head = orjson.loads(head_json) if orjson is not None else json.loads(head_json)
+        return {"columns": head["columns"], "rows": head["data"]}
+
+    def _arrow_array(self, series):
+        """Convert a Series to an Arrow array, or None if pyarrow can't represent it"""
+        if self.pyarrow is None:
+            return None
+        try:
+            return self.pyarrow.array(series, from_pandas=True)
+        except (self.pyarrow.ArrowException, TypeError, ValueError):
+            # Mixed-type object columns have no Arrow equivalent
+            return None
+
+    def _count_dense_integers(self, series):
+        """Count a NumPy integer column with one np.bincount pass, most frequent first
+
+        Returns None when the column isn't a plain integer column or its values
+        span a range wider than its length, where the count array would
+        outgrow the data.
+        """
+        import numpy as np
+
+        if series.dtype.kind not in "iu" or len(series) == 0:
+            return None
+
+        values = series.to_numpy()
+        low, high = int(values.min()), int(values.max())
+        if high - low >= len(values) or high > np.iinfo(np.int64).max:
+            return None
+
+        counts = np.bincount(values.astype(np.int64, copy=False) - low)
+        present = np.flatnonzero(counts)
+        present_counts = counts[present]
+        order = np.argsort(-present_counts, kind="stable")
+        return dict(zip((present[order] + low).tolist(), present_counts[order].tolist()))
+
+    def _value_counts(self, series):
+        """Count occurrences of each non-null value, most frequent first"""
+        # Categoricals are counted by bincounting their integer codes
+        if isinstance(series.dtype, self.pandas.CategoricalDtype):
+            counts = series.value_counts()
+            return counts[counts > 0].to_dict()
+
+        counted = self._count_dense_integers(series)
+        if counted is not None:
+            return counted
+
+        # Arrow counts in a single C++ hash aggregation pass
+        arr = self._arrow_array(series)
+        if arr is None:
+            return series.value_counts().to_dict()
+
+        pc = self.pyarrow.compute
+        counted = pc.value_counts(arr.drop_null())
+        order = pc.array_sort_indices(
+            counted.field("counts"), order="descending")
+        counted = counted.take(order)
+        return dict(zip(counted.field("values").to_pylist(),
+                        counted.field("counts").to_pylist()))
+
+    @functools.cached_property
+    def _to_excel_styles_headers(self):
+        """Whether this pandas version's df.to_excel styles header cells"""
+        from pandas.io.formats.excel import ExcelFormatter
+        return hasattr(ExcelFormatter, "header_style")
+
+    def _can_stream_dataframe(self, df):
+        """Check if a DataFrame has a flat layout suitable for row streaming"""
+        return (not isinstance(df.columns, self.pandas.MultiIndex)
+                and not isinstance(df.index, self.pandas.MultiIndex))
+
+    def _stream_dataframe_to_excel(self, df, filename, sheet_name, index):
+        """Write a DataFrame row by row with xlsxwriter's constant memory mode"""
+        import numpy as np
+
+        # Infinities are written as "inf"/"-inf" text, matching df.to_excel's
+        # default inf_rep; xlsxwriter rejects them as numbers
+        floats = df.select_dtypes("floating")
+        if floats.shape[1] and np.isinf(floats.to_numpy()).any():
+            df = df.replace({np.inf: "inf", -np.inf: "-inf"})
+
+        # Missing values are written as blank cells, matching df.to_excel
+        if df.isna().values.any():
+            df = df.astype(object).where(df.notna(), None)
+
+        options = {
+            'constant_memory': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+            # Any infinity left in object columns becomes #NUM! instead of failing
+            'nan_inf_to_errors': True
+        }
+        # Large sheets can push the zipped XML past the 4GB zip limit
+        if df.shape[0] * df.shape[1] > LARGE_FRAME_CELLS:
+            options['use_zip64'] = True
+
+        workbook = self.xlsxwriter.Workbook(filename, options)
+        try:
+            worksheet = workbook.add_worksheet(sheet_name)
+            # pandas 2.x df.to_excel writes the header row and index labels
+            # bold, bordered and centred; pandas 3 dropped that styling
+            header_format = None
+            if self._to_excel_styles_headers:
+                header_format = workbook.add_format(
+                    {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+
+            header = [str(col) for col in df.columns]
+            if index:
+                if df.index.name is not None:
+                    worksheet.write(0, 0, str(df.index.name), header_format)
+                worksheet.write_row(0, 1, header, header_format)
+            else:
+                worksheet.write_row(0, 0, header, header_format)
+
+            for row_num, row in enumerate(df.itertuples(index=index, name=None), 1):
+                if index:
+                    worksheet.write(row_num, 0, row[0], header_format)
+                    worksheet.write_row(row_num, 1, row[1:])
+                else:
+                    worksheet.write_row(row_num, 0, row)
+        finally:
+            workbook.close()
+
     async def dataframe_to_excel(self, df, filename, sheet_name="Sheet1", index=True, **kwargs):
         """Export DataFrame to Excel file"""
         try:
@@ -519,13 +1204,56 @@ class XlsxWriterService:
             if not isinstance(df, self.pandas.DataFrame):
                 return {"error": "Invalid DataFrame"}
 
-            # Export to Excel
-            df.to_excel(filename, sheet_name=sheet_name, index=index, **kwargs)
+            # Stream rows straight through xlsxwriter unless the caller needs
+            # engine-specific options that only df.to_excel understands
+            if kwargs or not self.initialized or not self._can_stream_dataframe(df):
+                df.to_excel(filename, sheet_name=sheet_name,
+                            index=index, **kwargs)
+            else:
+                self._stream_dataframe_to_excel(
+                    df, filename, sheet_name, index)
 
             return {"filename": filename, "sheet_name": sheet_name, "rows": len(df), "columns": len(df.columns), "status": "exported"}
         except Exception as e:
             return {"error": f"Error exporting to Excel: {str(e)}"}
 
+    async def dataframe_to_parquet(self, df, filename, index=True, **kwargs):
+        """Export DataFrame to Parquet file"""
+        try:
+            self._check_pandas_available()
+
+            # Check if valid DataFrame
+            if not isinstance(df, self.pandas.DataFrame):
+                return {"error": "Invalid DataFrame"}
+
+            # Export to Parquet
+            kwargs.setdefault("compression", "zstd")
+            df.to_parquet(filename, engine="pyarrow", index=index, **kwargs)
+
+            return {"filename": filename, "rows": len(df), "columns": len(df.columns), "status": "exported"}
+        except Exception as e:
+            return {"error": f"Error exporting to Parquet: {str(e)}"}
+
+    async def dataframe_to_feather(self, df, filename, **kwargs):
+        """Export DataFrame to Feather (Arrow IPC) file"""
+        try:
+            self._check_pandas_available()
+
+            # Check if valid DataFrame
+            if not isinstance(df, self.pandas.DataFrame):
+                return {"error": "Invalid DataFrame"}
+
+            # Feather only stores default indexes, so move any other into columns
+            if not isinstance(df.index, self.pandas.RangeIndex):
+                df = df.reset_index()
+
+            # Export to Feather
+            df.to_feather(filename, **kwargs)
+
+            return {"filename": filename, "rows": len(df), "columns": len(df.columns), "status": "exported"}
+        except Exception as e:
+            return {"error": f"Error exporting to Feather: {str(e)}"}
+
     async def dataframe_to_csv(self, df, filename, index=True, **kwargs):
         """Export DataFrame to CSV file"""
         try:
@@ -546,6 +1274,25 @@ class XlsxWriterService:
     # Data manipulation methods
     #
 
+    def _isin_index(self, values, max_entries=32):
+        """Get a prebuilt Index for an 'in' filter so its hash table is reused"""
+        try:
+            # Include types so equal-but-distinct values like 1 and True don't collide
+            key = tuple((type(v), v) for v in values)
+            index = self._isin_cache.get(key)
+        except TypeError:
+            # Unhashable members can't be cached, let pandas handle them
+            return values
+
+        if index is None:
+            index = self.pandas.Index(values)
+            self._isin_cache[key] = index
+            if len(self._isin_cache) > max_entries:
+                self._isin_cache.popitem(last=False)
+        else:
+            self._isin_cache.move_to_end(key)
+        return index
+
     async def filter_dataframe(self, df, query=None, column=None, value=None, operator="=="):
         """Filter DataFrame by query or column condition"""
         try:
@@ -557,8 +1304,18 @@ class XlsxWriterService:
 
             # Filter by query string
             if query:
+                # Unordered categoricals only support equality, so columns the
+                # query mentions are compared on their plain values
+                df = self._decode_categoricals(
+                    df, [col for col in df.columns if str(col) in query])
                 try:
-                    filtered_df = df.query(query)
+                    if self.numexpr_available:
+                        try:
+                            return df.query(query, engine="numexpr", parser="pandas")
+                        except Exception:
+                            # numexpr can't evaluate string methods, regex, etc.
+                            pass
+                    filtered_df = df.query(query, engine="python")
                     return filtered_df
                 except Exception as e:
                     return {"error": f"Error in query: {str(e)}"}
@@ -568,22 +1325,26 @@ class XlsxWriterService:
                 if column not in df.columns:
                     return {"error": f"Column '{column}' not found"}
 
-                if operator == "==":
-                    filtered_df = df[df[column] == value]
-                elif operator == "!=":
-                    filtered_df = df[df[column] != value]
-                elif operator == ">":
-                    filtered_df = df[df[column] > value]
-                elif operator == ">=":
-                    filtered_df = df[df[column] >= value]
-                elif operator == "<":
-                    filtered_df = df[df[column] < value]
-                elif operator == "<=":
-                    filtered_df = df[df[column] <= value]
+                if operator in _COMPARISONS:
+                    series = df[column]
+                    if (operator not in ("==", "!=")
+                            and isinstance(series.dtype, self.pandas.CategoricalDtype)):
+                        series = series.astype(series.cat.categories.dtype)
+                    compare = _COMPARISONS[operator]
+                    # Plain NumPy numeric columns are compared as raw arrays,
+                    # skipping pandas' index alignment and dtype dispatch
+                    if (series.dtype.kind in "iuf"
+                            and not self.pandas.api.types.is_extension_array_dtype(series.dtype)
+                            and isinstance(value, (int, float)) and not isinstance(value, bool)):
+                        mask = compare(series.to_numpy(), value)
+                    else:
+                        mask = compare(series, value)
+                    filtered_df = df[mask]
                 elif operator == "in":
                     if not isinstance(value, list):
                         return {"error": "Value must be a list when using 'in' operator"}
-                    filtered_df = df[df[column].isin(value)]
+                    filtered_df = df[df[column].isin(
+                        self._isin_index(value))]
                 elif operator == "contains":
                     filtered_df = df[df[column].astype(
                         str).str.contains(str(value))]
@@ -597,6 +1358,38 @@ class XlsxWriterService:
         except Exception as e:
             return {"error": f"Error filtering DataFrame: {str(e)}"}
 
+    def _decode_categoricals(self, df, columns):
+        """Return df with the given categorical columns converted back to their values"""
+        decoded = {col: df[col].cat.categories.dtype for col in columns
+                   if isinstance(df[col].dtype, self.pandas.CategoricalDtype)}
+        return df.astype(decoded) if decoded else df
+
+    def _has_categorical(self, df, columns):
+        """Check for categorical columns, which pandas already sorts and groups by code"""
+        return any(isinstance(df[col].dtype, self.pandas.CategoricalDtype) for col in columns)
+
+    def _sort_dataframe_arrow(self, df, by, ascending):
+        """Sort a DataFrame with pyarrow.compute.sort_indices
+
+        Only the key columns are converted to Arrow; the resulting order is
+        applied with df.take so the index and other columns are kept as is.
+        Returns None when pyarrow is unavailable or can't handle the keys.
+        """
+        pa = self.pyarrow
+        if pa is None or self._has_categorical(df, by):
+            return None
+
+        try:
+            keys = pa.Table.from_pandas(df[by], preserve_index=False)
+        except (pa.ArrowException, TypeError, ValueError):
+            return None
+
+        sort_keys = [(col, "ascending" if asc else "descending")
+                     for col, asc in zip(keys.column_names, ascending)]
+        # Arrow places missing values last, matching sort_values' default
+        indices = pa.compute.sort_indices(keys, sort_keys=sort_keys)
+        return df.take(indices.to_numpy())
+
     async def sort_dataframe(self, df, by, ascending=True):
         """Sort DataFrame by columns"""
         try:
@@ -619,13 +1412,85 @@ class XlsxWriterService:
             if not isinstance(ascending, list):
                 ascending = [ascending] * len(by)
 
-            # Sort the DataFrame
-            sorted_df = df.sort_values(by=by, ascending=ascending)
+            # Sort the DataFrame, preferring Arrow's multithreaded sort
+            sorted_df = self._sort_dataframe_arrow(df, by, ascending)
+            if sorted_df is None:
+                sorted_df = df.sort_values(by=by, ascending=ascending)
 
             return sorted_df
         except Exception as e:
             return {"error": f"Error sorting DataFrame: {str(e)}"}
 
+    def _group_dataframe_arrow(self, df, by, agg_func):
+        """Group and aggregate with pyarrow's Table.group_by
+
+        Produces the same frame as df.groupby(by).agg(agg_func).reset_index()
+        for simple named aggregations. Returns None for anything else, or
+        when pyarrow is unavailable, so the caller can fall back to pandas.
+        """
+        pa = self.pyarrow
+        if pa is None:
+            return None
+
+        if isinstance(agg_func, str):
+            aggregations = {col: agg_func for col in df.columns if col not in by}
+        elif isinstance(agg_func, dict):
+            aggregations = dict(agg_func)
+        else:
+            return None
+
+        columns = list(by) + list(aggregations)
+        if (not all(isinstance(col, str) and col in df.columns for col in columns)
+                or not all(isinstance(func, str) and func in _ARROW_AGGREGATIONS
+                           for func in aggregations.values())
+                or self._has_categorical(df, columns)):
+            return None
+
+        # Arrow's arithmetic result types differ from pandas' for narrower
+        # inputs (bool sums come back as uint64, float32 means as double), so
+        # those only take this path for plain 64-bit numeric columns
+        if not all(func not in ("sum", "mean", "std", "var")
+                   or str(df[col].dtype) in ("int64", "float64")
+                   for col, func in aggregations.items()):
+            return None
+
+        pc = pa.compute
+        specs = []
+        output_names = []
+        for col, func in aggregations.items():
+            arrow_func, ddof = _ARROW_AGGREGATIONS[func]
+            if arrow_func == "sum":
+                # pandas sums an all-NaN group to 0, not NaN
+                specs.append((col, arrow_func,
+                              pc.ScalarAggregateOptions(skip_nulls=True, min_count=0)))
+            elif ddof is None:
+                specs.append((col, arrow_func))
+            else:
+                specs.append(
+                    (col, arrow_func, pc.VarianceOptions(ddof=ddof)))
+            output_names.append(f"{col}_{arrow_func}")
+
+        try:
+            table = pa.Table.from_pandas(df[columns], preserve_index=False)
+
+            # pandas drops groups whose key is missing
+            valid = None
+            for col in by:
+                col_valid = pc.is_valid(table[col])
+                valid = col_valid if valid is None else pc.and_(
+                    valid, col_valid)
+            table = table.filter(valid)
+
+            grouped = table.group_by(list(by)).aggregate(specs)
+        except (pa.ArrowException, TypeError, ValueError):
+            return None
+
+        # Arrow names outputs "<column>_<function>" and leaves groups unsorted
+        grouped = grouped.select(list(by) + output_names)
+        grouped = grouped.rename_columns(list(by) + list(aggregations))
+        grouped = grouped.sort_by([(col, "ascending") for col in by])
+        return grouped.to_pandas()
+
     async def group_dataframe(self, df, by, agg_func=None):
         """Group DataFrame and apply aggregation"""
         try:
@@ -644,8 +1509,15 @@ class XlsxWriterService:
                 if col not in df.columns:
                     return {"error": f"Column '{col}' not found"}
 
-            # Group by columns
-            grouped = df.groupby(by)
+            # Arrow's hash aggregation runs multithreaded in C++
+            result_df = self._group_dataframe_arrow(
+                df, by, agg_func or "count")
+            if result_df is not None:
+                return result_df
+
+            # Group by columns; observed=True keeps categorical keys from
+            # producing empty groups for categories absent from the data
+            grouped = df.groupby(by, observed=True)
 
             # Apply aggregation function
             if agg_func:
@@ -679,13 +1551,40 @@ class XlsxWriterService:
             # Convert to dict for JSON serialization
             result = {}
             for col in desc_df.columns:
-                result[str(col)] = {str(idx): float(val) if not pd.isna(val) else None
+                result[str(col)] = {str(idx): float(val) if not self.pandas.isna(val) else None
                                     for idx, val in desc_df[col].items()}
 
             return result
         except Exception as e:
             return {"error": f"Error describing DataFrame: {str(e)}"}
 
+    def correlation(self, df, method="pearson"):
+        """Get correlation matrix for the numeric columns of a DataFrame"""
+        try:
+            self._check_pandas_available()
+
+            # Check if valid DataFrame
+            if not isinstance(df, self.pandas.DataFrame):
+                return {"error": "Invalid DataFrame"}
+
+            numeric_df = df.select_dtypes(include="number")
+
+            # Without missing values Pearson reduces to a single BLAS-backed
+            # np.corrcoef call; float32 is ample for 4-decimal output
+            if method == "pearson" and len(numeric_df) > 1 and not numeric_df.isna().values.any():
+                import numpy as np
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    matrix = np.corrcoef(numeric_df.to_numpy(
+                        dtype=np.float32).T).astype(np.float64)
+                corr = self.pandas.DataFrame(
+                    np.atleast_2d(matrix), index=numeric_df.columns, columns=numeric_df.columns)
+            else:
+                corr = numeric_df.corr(method=method)
+
+            return corr.round(4).to_dict()
+        except Exception as e:
+            return {"error": f"Error calculating correlation: {str(e)}"}
+
 
 # Tool function definitions that will be registered with MCP
 async def xlsx_create_workbook(filename: str, ctx: Context = None) -> str:
@@ -703,9 +1602,9 @@ async def xlsx_create_workbook(filename: str, ctx: Context = None) -> str:
 
     try:
         result = await xlsx.create_workbook(filename)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _to_json({"error": str(e)})
 
 
 async def xlsx_add_worksheet(filename: str, name: str = None, ctx: Context = None) -> str:
@@ -724,9 +1623,9 @@ async def xlsx_add_worksheet(filename: str, name: str = None, ctx: Context = Non
 
     try:
         result = await xlsx.add_worksheet(filename, name)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _to_json({"error": str(e)})
 
 
 async def xlsx_write_data(filename: str, worksheet: str, row: int, col: int,
@@ -750,9 +1649,9 @@ async def xlsx_write_data(filename: str, worksheet: str, row: int, col: int,
 
     try:
         result = await xlsx.write_data(filename, worksheet, row, col, data, format)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _to_json({"error": str(e)})
 
 
 async def xlsx_write_matrix(filename: str, worksheet: str, start_row: int, start_col: int,
@@ -777,9 +1676,9 @@ async def xlsx_write_matrix(filename: str, worksheet: str, start_row: int, start
 
     try:
         result = await xlsx.write_matrix(filename, worksheet, start_row, start_col, data, formats)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _to_json({"error": str(e)})
 
 
 async def xlsx_add_format(filename: str, format_name: str, properties: Dict[str, Any],
@@ -800,9 +1699,32 @@ async def xlsx_add_format(filename: str, format_name: str, properties: Dict[str,
 
     try:
         result = await xlsx.add_format(filename, format_name, properties)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _to_json({"error": str(e)})
+
+
+async def xlsx_add_formats(filename: str, formats: Dict[str, Dict[str, Any]],
+                           ctx: Context = None) -> str:
+    """Create several cell formats at once
+
+    Parameters:
+    - filename: Path to the Excel file
+    - formats: Dictionary mapping format names to their properties
+      (e.g., {'header': {'bold': True}, 'money': {'num_format': '$#,##0.00'}})
+
+    Returns:
+    - JSON string containing the result
+    """
+    xlsx = _get_xlsx_service()
+    if not xlsx:
+        return "XlsxWriter service not properly initialized. Check if xlsxwriter library is installed."
+
+    try:
+        result = await xlsx.add_formats(filename, formats)
+        return _to_json(result)
+    except Exception as e:
+        return _to_json({"error": str(e)})
 
 
 async def xlsx_add_chart(filename: str, worksheet: str, chart_type: str, data_range: List[Dict[str, Any]],
@@ -827,9 +1749,9 @@ async def xlsx_add_chart(filename: str, worksheet: str, chart_type: str, data_ra
 
     try:
         result = await xlsx.add_chart(filename, worksheet, chart_type, data_range, position, options)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _to_json({"error": str(e)})
 
 
 async def xlsx_add_image(filename: str, worksheet: str, image_path: str,
@@ -853,9 +1775,9 @@ async def xlsx_add_image(filename: str, worksheet: str, image_path: str,
 
     try:
         result = await xlsx.add_image(filename, worksheet, image_path, position, options)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _to_json({"error": str(e)})
 
 
 async def xlsx_add_formula(filename: str, worksheet: str, row: int, col: int,
@@ -879,9 +1801,9 @@ async def xlsx_add_formula(filename: str, worksheet: str, row: int, col: int,
 
     try:
         result = await xlsx.add_formula(filename, worksheet, row, col, formula, format)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _to_json({"error": str(e)})
 
 
 async def xlsx_add_table(filename: str, worksheet: str, start_row: int, start_col: int,
@@ -907,9 +1829,9 @@ async def xlsx_add_table(filename: str, worksheet: str, start_row: int, start_co
 
     try:
         result = await xlsx.add_table(filename, worksheet, start_row, start_col, end_row, end_col, options)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _to_json({"error": str(e)})
 
 
 async def xlsx_close_workbook(filename: str, ctx: Context = None) -> str:
@@ -927,9 +1849,9 @@ async def xlsx_close_workbook(filename: str, ctx: Context = None) -> str:
 
     try:
         result = await xlsx.close_workbook(filename)
-        return json.dumps(result, indent=2)
+        return _to_json(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _to_json({"error": str(e)})
 
 
 #
@@ -939,6 +1861,7 @@ async def xlsx_close_workbook(filename: str, ctx: Context = None) -> str:
 async def xlsx_read_excel(filename: str, sheet_name: Union[str, int] = 0,
                           output_id: str = None, header: Union[int, List[int], None] = 0,
                           names: List[str] = None, skiprows: Union[int, List[int], None] = None,
+                          downcast: bool = False, categorize: bool = False,
                           ctx: Context = None) -> str:
     """Read an Excel file into a pandas DataFrame
 
@@ -949,6 +1872,11 @@ async def xlsx_read_excel(filename: str, sheet_name: Union[str, int] = 0,
     - header: Row(s) to use as column names (default: 0)
     - names: List of custom column names (default: None)
     - skiprows: Row indices to skip or number of rows to skip (default: None)
+    - downcast: Store numeric columns in the narrowest dtype that holds their
+      values exactly, e.g. int64 -> int8. Arithmetic in later queries then
+      runs in the narrow type and can overflow (default: False)
+    - categorize: Store string columns of 1,000+ rows with fewer than half
+      distinct values as categoricals to save memory (default: False)
 
     Returns:
     - JSON string with DataFrame information
@@ -968,33 +1896,48 @@ async def xlsx_read_excel(filename: str, sheet_name: Union[str, int] = 0,
 
         # Handle both single sheet and multiple sheets
         if isinstance(result, dict) and "error" in result:
-            return json.dumps(result, indent=2)
+            return _to_json(result)
 
         elif isinstance(result, dict) and "sheets" in result:
-            # Multiple sheets returned
+            # Multiple sheets returned; downcast them in parallel threads
+            dataframes = result["dataframes"]
+            if downcast:
+                max_workers = max(min(len(dataframes), os.cpu_count() or 1), 1)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    downcasts = dict(zip(dataframes, executor.map(
+                        xlsx._downcast_numeric, dataframes.values())))
+            else:
+                downcasts = {name: (df, {}) for name, df in dataframes.items()}
+
+            # Only shape and columns are reported per sheet, which the registry
+            # already holds, so the full dataframe_info is left until requested
             sheet_info = {}
-            for sheet_name, df in result["dataframes"].items():
+            for sheet_name, (df, dtype_map) in downcasts.items():
                 sheet_id = f"{output_id}_{sheet_name}"
-                _store_dataframe(sheet_id, df)
-                info = await xlsx.dataframe_info(df)
+                _store_dataframe(sheet_id, df, categorize)
+                metadata = _get_dataframe_metadata(sheet_id)
                 sheet_info[sheet_name] = {
                     "dataframe_id": sheet_id,
-                    "shape": info["shape"],
-                    "columns": info["columns"]
+                    "shape": metadata["shape"],
+                    "columns": metadata["columns"],
+                    "dtype_map": dtype_map
                 }
 
-            return json.dumps({
+            return _to_json({
                 "filename": filename,
                 "sheets": result["sheets"],
                 "sheet_info": sheet_info,
                 "status": "read",
                 "message": f"Multiple sheets read. Access individual DataFrames using their IDs."
-            }, indent=2)
+            })
 
         else:
             # Single sheet returned
-            _store_dataframe(output_id, result)
-            info = await xlsx.dataframe_info(result)
+            dtype_map = {}
+            if downcast:
+                result, dtype_map = xlsx._downcast_numeric(result)
+            _store_dataframe(output_id, result, categorize)
+            info = _get_dataframe_info(xlsx, output_id, _get_dataframe(output_id))
 
             response = {
                 "filename": filename,
@@ -1002,21 +1945,23 @@ async def xlsx_read_excel(filename: str, sheet_name: Union[str, int] = 0,
                 "shape": info["shape"],
                 "columns": info["columns"],
                 "dtypes": info["dtypes"],
+                "dtype_map": dtype_map,
                 "has_nulls": info["has_nulls"],
                 "head": info["head"],
                 "status": "read"
             }
 
-            return json.dumps(response, indent=2)
+            return _to_json(response)
 
     except Exception as e:
-        return json.dumps({"error": f"Error reading Excel file: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error reading Excel file: {str(e)}"})
 
 
 async def xlsx_read_csv(filename: str, output_id: str = None, delimiter: str = ",",
                         header: Union[int, List[int], None] = 0, names: List[str] = None,
                         skiprows: Union[int, List[int], None] = None, encoding: str = None,
-                        ctx: Context = None) -> str:
+                        chunksize: int = None, downcast: bool = False,
+                        categorize: bool = False, ctx: Context = None) -> str:
     """Read a CSV file into a pandas DataFrame
 
     Parameters:
@@ -1027,6 +1972,16 @@ async def xlsx_read_csv(filename: str, output_id: str = None, delimiter: str = "
     - names: List of custom column names (default: None)
     - skiprows: Row indices to skip or number of rows to skip (default: None)
     - encoding: File encoding (default: None, pandas will try to detect)
+    - chunksize: Read the file in chunks of this many rows, stored as
+      output_id_0, output_id_1, ... instead of one DataFrame. Chunks are
+      kept on disk and loaded on use; requires pyarrow (default: None)
+    - downcast: Store numeric columns in the narrowest dtype that holds their
+      values exactly, e.g. int64 -> int8; not applied to chunked reads, whose
+      chunks would otherwise disagree on dtypes. Arithmetic in later queries
+      then runs in the narrow type and can overflow (default: False)
+    - categorize: Store string columns of 1,000+ rows with fewer than half
+      distinct values as categoricals to save memory; not applied to chunked
+      reads (default: False)
 
     Returns:
     - JSON string with DataFrame information
@@ -1053,16 +2008,56 @@ async def xlsx_read_csv(filename: str, output_id: str = None, delimiter: str = "
         if encoding:
             kwargs["encoding"] = encoding
 
+        # Spill each chunk to disk as it is parsed; only the HOT_DATAFRAMES
+        # most recently used chunks stay in memory
+        if chunksize:
+            if xlsx.pyarrow is None:
+                return _to_json({"error": "chunksize requires pyarrow to keep chunks on disk; "
+                                          "install pyarrow or read the file without chunksize"})
+
+            reader = await xlsx.read_csv_chunks(filename, chunksize, **kwargs)
+
+            if isinstance(reader, dict) and "error" in reader:
+                return _to_json(reader)
+
+            chunk_ids = []
+            rows = 0
+            columns = []
+            with reader:
+                for i, chunk in enumerate(reader):
+                    chunk_ids.append(
+                        _store_dataframe(f"{output_id}_{i}", chunk, spill=True))
+                    rows += len(chunk)
+                    columns = chunk.columns.tolist()
+
+            # Drop chunks left over from an earlier read that had more of them
+            stale = len(chunk_ids)
+            while _clear_dataframe(f"{output_id}_{stale}"):
+                stale += 1
+
+            return _to_json({
+                "filename": filename,
+                "chunk_ids": chunk_ids,
+                "num_chunks": len(chunk_ids),
+                "rows": rows,
+                "columns": columns,
+                "status": "read"
+            })
+
         result = await xlsx.read_csv(filename, **kwargs)
 
         if isinstance(result, dict) and "error" in result:
-            return json.dumps(result, indent=2)
+            return _to_json(result)
+
+        dtype_map = {}
+        if downcast:
+            result, dtype_map = xlsx._downcast_numeric(result)
 
         # Store DataFrame in memory
-        _store_dataframe(output_id, result)
+        _store_dataframe(output_id, result, categorize)
 
         # Get DataFrame info
-        info = await xlsx.dataframe_info(result)
+        info = _get_dataframe_info(xlsx, output_id, _get_dataframe(output_id))
 
         response = {
             "filename": filename,
@@ -1070,15 +2065,16 @@ async def xlsx_read_csv(filename: str, output_id: str = None, delimiter: str = "
             "shape": info["shape"],
             "columns": info["columns"],
             "dtypes": info["dtypes"],
+            "dtype_map": dtype_map,
             "has_nulls": info["has_nulls"],
             "head": info["head"],
             "status": "read"
         }
 
-        return json.dumps(response, indent=2)
+        return _to_json(response)
 
     except Exception as e:
-        return json.dumps({"error": f"Error reading CSV file: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error reading CSV file: {str(e)}"})
 
 
 async def xlsx_get_sheet_names(filename: str, ctx: Context = None) -> str:
@@ -1098,20 +2094,20 @@ async def xlsx_get_sheet_names(filename: str, ctx: Context = None) -> str:
         result = await xlsx.get_excel_sheet_names(filename)
 
         if isinstance(result, dict) and "error" in result:
-            return json.dumps(result, indent=2)
+            return _to_json(result)
 
-        return json.dumps({
+        return _to_json({
             "filename": filename,
             "sheet_names": result,
             "count": len(result),
             "status": "success"
-        }, indent=2)
+        })
 
     except Exception as e:
-        return json.dumps({"error": f"Error getting sheet names: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error getting sheet names: {str(e)}"})
 
 
-async def xlsx_dataframe_info(dataframe_id: str, ctx: Context = None) -> str:
+def xlsx_dataframe_info(dataframe_id: str, ctx: Context = None) -> str:
     """Get information about a DataFrame
 
     Parameters:
@@ -1125,16 +2121,15 @@ async def xlsx_dataframe_info(dataframe_id: str, ctx: Context = None) -> str:
         return "XlsxWriter service not properly initialized. Check if pandas and xlsxwriter libraries are installed."
 
     try:
-        # Get DataFrame from memory
-        df = _get_dataframe(dataframe_id)
-        if df is None:
-            return json.dumps({"error": f"DataFrame with ID '{dataframe_id}' not found"}, indent=2)
+        # Check the DataFrame exists without loading it
+        if _get_dataframe_metadata(dataframe_id) is None:
+            return _to_json({"error": f"DataFrame with ID '{dataframe_id}' not found"})
 
-        # Get DataFrame info
-        info = await xlsx.dataframe_info(df)
+        # Get DataFrame info, cached since the DataFrame was stored
+        info = _get_dataframe_info(xlsx, dataframe_id)
 
         if isinstance(info, dict) and "error" in info:
-            return json.dumps(info, indent=2)
+            return _to_json(info)
 
         response = {
             "dataframe_id": dataframe_id,
@@ -1142,19 +2137,20 @@ async def xlsx_dataframe_info(dataframe_id: str, ctx: Context = None) -> str:
             "columns": info["columns"],
             "dtypes": info["dtypes"],
             "has_nulls": info["has_nulls"],
+            "null_counts": info["null_counts"],
             "memory_usage": info["memory_usage"],
             "info": info["info"],
             "head": info["head"],
             "status": "success"
         }
 
-        return json.dumps(response, indent=2)
+        return _to_json(response)
 
     except Exception as e:
-        return json.dumps({"error": f"Error getting DataFrame info: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error getting DataFrame info: {str(e)}"})
 
 
-async def xlsx_list_dataframes(ctx: Context = None) -> str:
+def xlsx_list_dataframes(ctx: Context = None) -> str:
     """List all DataFrames currently in memory
 
     Returns:
@@ -1163,30 +2159,30 @@ async def xlsx_list_dataframes(ctx: Context = None) -> str:
     try:
         dataframe_ids = _list_dataframes()
 
-        # Get basic info for each DataFrame
+        # Get basic info for each DataFrame from metadata, so spilled
+        # DataFrames are not loaded back from disk
         dataframes_info = {}
-        xlsx = _get_xlsx_service()
 
         for df_id in dataframe_ids:
-            df = _get_dataframe(df_id)
-            if df is not None:
+            metadata = _get_dataframe_metadata(df_id)
+            if metadata is not None:
                 dataframes_info[df_id] = {
-                    "shape": df.shape,
-                    "columns": list(df.columns)
+                    "shape": metadata["shape"],
+                    "columns": metadata["columns"]
                 }
 
-        return json.dumps({
+        return _to_json({
             "dataframe_ids": dataframe_ids,
             "count": len(dataframe_ids),
             "dataframes_info": dataframes_info,
             "status": "success"
-        }, indent=2)
+        })
 
     except Exception as e:
-        return json.dumps({"error": f"Error listing DataFrames: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error listing DataFrames: {str(e)}"})
 
 
-async def xlsx_clear_dataframe(dataframe_id: str, ctx: Context = None) -> str:
+def xlsx_clear_dataframe(dataframe_id: str, ctx: Context = None) -> str:
     """Remove a DataFrame from memory
 
     Parameters:
@@ -1199,23 +2195,24 @@ async def xlsx_clear_dataframe(dataframe_id: str, ctx: Context = None) -> str:
         result = _clear_dataframe(dataframe_id)
 
         if result:
-            return json.dumps({
+            return _to_json({
                 "dataframe_id": dataframe_id,
                 "status": "cleared",
                 "message": f"DataFrame with ID '{dataframe_id}' has been removed from memory"
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _to_json({
                 "error": f"DataFrame with ID '{dataframe_id}' not found",
                 "status": "not_found"
-            }, indent=2)
+            })
 
     except Exception as e:
-        return json.dumps({"error": f"Error clearing DataFrame: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error clearing DataFrame: {str(e)}"})
 
 
 async def xlsx_dataframe_to_excel(dataframe_id: str, filename: str, sheet_name: str = "Sheet1",
-                                  index: bool = True, ctx: Context = None) -> str:
+                                  index: bool = True, format: str = "xlsx",
+                                  ctx: Context = None) -> str:
     """Export a DataFrame to an Excel file
 
     Parameters:
@@ -1223,6 +2220,8 @@ async def xlsx_dataframe_to_excel(dataframe_id: str, filename: str, sheet_name:
     - filename: Path to save the Excel file
     - sheet_name: Name of the sheet (default: "Sheet1")
     - index: Whether to include the DataFrame index (default: True)
+    - format: Output format: "xlsx", "parquet" or "feather" (default: "xlsx").
+      Parquet and Feather skip XML serialization and are much faster for large DataFrames
 
     Returns:
     - JSON string with the result
@@ -1235,25 +2234,32 @@ async def xlsx_dataframe_to_excel(dataframe_id: str, filename: str, sheet_name:
         # Get DataFrame from memory
         df = _get_dataframe(dataframe_id)
         if df is None:
-            return json.dumps({"error": f"DataFrame with ID '{dataframe_id}' not found"}, indent=2)
-
-        # Export to Excel
-        result = await xlsx.dataframe_to_excel(df, filename, sheet_name=sheet_name, index=index)
+            return _to_json({"error": f"DataFrame with ID '{dataframe_id}' not found"})
+
+        # Export to the requested format
+        if format == "parquet":
+            result = await xlsx.dataframe_to_parquet(df, filename, index=index)
+        elif format == "feather":
+            result = await xlsx.dataframe_to_feather(df, filename)
+        elif format == "xlsx":
+            result = await xlsx.dataframe_to_excel(df, filename, sheet_name=sheet_name, index=index)
+        else:
+            return _to_json({"error": f"Unknown format: {format}"})
 
         if isinstance(result, dict) and "error" in result:
-            return json.dumps(result, indent=2)
+            return _to_json(result)
 
-        return json.dumps({
+        return _to_json({
             "dataframe_id": dataframe_id,
             "filename": filename,
             "sheet_name": sheet_name,
             "rows": result["rows"],
             "columns": result["columns"],
             "status": "exported"
-        }, indent=2)
+        })
 
     except Exception as e:
-        return json.dumps({"error": f"Error exporting DataFrame to Excel: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error exporting DataFrame to Excel: {str(e)}"})
 
 
 async def xlsx_dataframe_to_csv(dataframe_id: str, filename: str, index: bool = True,
@@ -1278,24 +2284,24 @@ async def xlsx_dataframe_to_csv(dataframe_id: str, filename: str, index: bool =
         # Get DataFrame from memory
         df = _get_dataframe(dataframe_id)
         if df is None:
-            return json.dumps({"error": f"DataFrame with ID '{dataframe_id}' not found"}, indent=2)
+            return _to_json({"error": f"DataFrame with ID '{dataframe_id}' not found"})
 
         # Export to CSV
         result = await xlsx.dataframe_to_csv(df, filename, index=index, encoding=encoding, sep=sep)
 
         if isinstance(result, dict) and "error" in result:
-            return json.dumps(result, indent=2)
+            return _to_json(result)
 
-        return json.dumps({
+        return _to_json({
             "dataframe_id": dataframe_id,
             "filename": filename,
             "rows": result["rows"],
             "columns": result["columns"],
             "status": "exported"
-        }, indent=2)
+        })
 
     except Exception as e:
-        return json.dumps({"error": f"Error exporting DataFrame to CSV: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error exporting DataFrame to CSV: {str(e)}"})
 
 
 #
@@ -1326,7 +2332,7 @@ async def xlsx_filter_dataframe(dataframe_id: str, query: str = None, column: st
         # Get DataFrame from memory
         df = _get_dataframe(dataframe_id)
         if df is None:
-            return json.dumps({"error": f"DataFrame with ID '{dataframe_id}' not found"}, indent=2)
+            return _to_json({"error": f"DataFrame with ID '{dataframe_id}' not found"})
 
         # Set default output ID if not provided
         if not output_id:
@@ -1340,18 +2346,18 @@ async def xlsx_filter_dataframe(dataframe_id: str, query: str = None, column: st
             # Filter by column and value
             filtered_df = await xlsx.filter_dataframe(df, column=column, value=value, operator=operator)
         else:
-            return json.dumps({"error": "Either query or column+value must be provided"}, indent=2)
+            return _to_json({"error": "Either query or column+value must be provided"})
 
         if isinstance(filtered_df, dict) and "error" in filtered_df:
-            return json.dumps(filtered_df, indent=2)
+            return _to_json(filtered_df)
 
         # Store filtered DataFrame
         _store_dataframe(output_id, filtered_df)
 
         # Get DataFrame info
-        info = await xlsx.dataframe_info(filtered_df)
+        info = _get_dataframe_info(xlsx, output_id, filtered_df)
 
-        return json.dumps({
+        return _to_json({
             "original_id": dataframe_id,
             "filtered_id": output_id,
             "original_rows": df.shape[0],
@@ -1359,10 +2365,10 @@ async def xlsx_filter_dataframe(dataframe_id: str, query: str = None, column: st
             "columns": info["columns"],
             "head": info["head"],
             "status": "filtered"
-        }, indent=2)
+        })
 
     except Exception as e:
-        return json.dumps({"error": f"Error filtering DataFrame: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error filtering DataFrame: {str(e)}"})
 
 
 async def xlsx_sort_dataframe(dataframe_id: str, by: Union[str, List[str]],
@@ -1387,7 +2393,7 @@ async def xlsx_sort_dataframe(dataframe_id: str, by: Union[str, List[str]],
         # Get DataFrame from memory
         df = _get_dataframe(dataframe_id)
         if df is None:
-            return json.dumps({"error": f"DataFrame with ID '{dataframe_id}' not found"}, indent=2)
+            return _to_json({"error": f"DataFrame with ID '{dataframe_id}' not found"})
 
         # Set default output ID if not provided
         if not output_id:
@@ -1397,15 +2403,15 @@ async def xlsx_sort_dataframe(dataframe_id: str, by: Union[str, List[str]],
         sorted_df = await xlsx.sort_dataframe(df, by=by, ascending=ascending)
 
         if isinstance(sorted_df, dict) and "error" in sorted_df:
-            return json.dumps(sorted_df, indent=2)
+            return _to_json(sorted_df)
 
         # Store sorted DataFrame
         _store_dataframe(output_id, sorted_df)
 
         # Get DataFrame info
-        info = await xlsx.dataframe_info(sorted_df)
+        info = _get_dataframe_info(xlsx, output_id, sorted_df)
 
-        return json.dumps({
+        return _to_json({
             "original_id": dataframe_id,
             "sorted_id": output_id,
             "sorted_by": by if isinstance(by, str) else list(by),
@@ -1413,10 +2419,10 @@ async def xlsx_sort_dataframe(dataframe_id: str, by: Union[str, List[str]],
             "rows": sorted_df.shape[0],
             "head": info["head"],
             "status": "sorted"
-        }, indent=2)
+        })
 
     except Exception as e:
-        return json.dumps({"error": f"Error sorting DataFrame: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error sorting DataFrame: {str(e)}"})
 
 
 async def xlsx_group_dataframe(dataframe_id: str, by: Union[str, List[str]],
@@ -1441,7 +2447,7 @@ async def xlsx_group_dataframe(dataframe_id: str, by: Union[str, List[str]],
         # Get DataFrame from memory
         df = _get_dataframe(dataframe_id)
         if df is None:
-            return json.dumps({"error": f"DataFrame with ID '{dataframe_id}' not found"}, indent=2)
+            return _to_json({"error": f"DataFrame with ID '{dataframe_id}' not found"})
 
         # Set default output ID if not provided
         if not output_id:
@@ -1451,15 +2457,15 @@ async def xlsx_group_dataframe(dataframe_id: str, by: Union[str, List[str]],
         grouped_df = await xlsx.group_dataframe(df, by=by, agg_func=agg_func)
 
         if isinstance(grouped_df, dict) and "error" in grouped_df:
-            return json.dumps(grouped_df, indent=2)
+            return _to_json(grouped_df)
 
         # Store grouped DataFrame
         _store_dataframe(output_id, grouped_df)
 
         # Get DataFrame info
-        info = await xlsx.dataframe_info(grouped_df)
+        info = _get_dataframe_info(xlsx, output_id, grouped_df)
 
-        return json.dumps({
+        return _to_json({
             "original_id": dataframe_id,
             "grouped_id": output_id,
             "grouped_by": by if isinstance(by, str) else list(by),
@@ -1467,10 +2473,10 @@ async def xlsx_group_dataframe(dataframe_id: str, by: Union[str, List[str]],
             "rows": grouped_df.shape[0],
             "head": info["head"],
             "status": "grouped"
-        }, indent=2)
+        })
 
     except Exception as e:
-        return json.dumps({"error": f"Error grouping DataFrame: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error grouping DataFrame: {str(e)}"})
 
 
 async def xlsx_describe_dataframe(dataframe_id: str, include: Union[str, List[str]] = None,
@@ -1492,29 +2498,37 @@ async def xlsx_describe_dataframe(dataframe_id: str, include: Union[str, List[st
         return "XlsxWriter service not properly initialized. Check if pandas and xlsxwriter libraries are installed."
 
     try:
-        # Get DataFrame from memory
-        df = _get_dataframe(dataframe_id)
-        if df is None:
-            return json.dumps({"error": f"DataFrame with ID '{dataframe_id}' not found"}, indent=2)
+        if dataframe_id not in _dataframe_registry:
+            return _to_json({"error": f"DataFrame with ID '{dataframe_id}' not found"})
 
-        # Describe the DataFrame
-        result = await xlsx.describe_dataframe(df, include=include, exclude=exclude, percentiles=percentiles)
+        # Describe the DataFrame, reusing the last result for the same arguments
+        key = ("describe",) + tuple(
+            tuple(arg) if isinstance(arg, list) else arg
+            for arg in (include, exclude, percentiles))
+        result = _stats_cache.get(dataframe_id, {}).get(key)
+        if result is None:
+            result = await xlsx.describe_dataframe(
+                _get_dataframe(dataframe_id), include=include, exclude=exclude,
+                percentiles=percentiles)
 
-        if isinstance(result, dict) and "error" in result:
-            return json.dumps(result, indent=2)
+            if isinstance(result, dict) and "error" in result:
+                return _to_json(result)
 
-        return json.dumps({
+            _stats_cache.setdefault(dataframe_id, {})[key] = result
+
+        return _to_json({
             "dataframe_id": dataframe_id,
             "description": result,
             "status": "described"
-        }, indent=2)
+        })
 
     except Exception as e:
-        return json.dumps({"error": f"Error describing DataFrame: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error describing DataFrame: {str(e)}"})
 
 
-async def xlsx_get_column_values(dataframe_id: str, column: str, unique: bool = False,
-                                 count: bool = False, ctx: Context = None) -> str:
+def xlsx_get_column_values(dataframe_id: str, column: str, unique: bool = False,
+                           count: bool = False, limit: int = 10000,
+                           ctx: Context = None) -> str:
     """Get values from a specific column in a DataFrame
 
     Parameters:
@@ -1522,70 +2536,89 @@ async def xlsx_get_column_values(dataframe_id: str, column: str, unique: bool =
     - column: Name of the column to get values from
     - unique: Whether to return only unique values (default: False)
     - count: Whether to count occurrences of each value (default: False)
+    - limit: Maximum number of values to return when neither unique nor count is set (default: 10000)
 
     Returns:
     - JSON string with the column values
     """
+    xlsx = _get_xlsx_service()
+
     try:
         # Get DataFrame from memory
         df = _get_dataframe(dataframe_id)
         if df is None:
-            return json.dumps({"error": f"DataFrame with ID '{dataframe_id}' not found"}, indent=2)
+            return _to_json({"error": f"DataFrame with ID '{dataframe_id}' not found"})
 
         # Check if column exists
         if column not in df.columns:
-            return json.dumps({"error": f"Column '{column}' not found in DataFrame '{dataframe_id}'"}, indent=2)
+            return _to_json({"error": f"Column '{column}' not found in DataFrame '{dataframe_id}'"})
 
         if count:
             # Count occurrences of each value
-            value_counts = df[column].value_counts().to_dict()
+            if xlsx:
+                value_counts = xlsx._value_counts(df[column])
+            else:
+                value_counts = df[column].value_counts().to_dict()
 
-            return json.dumps({
+            return _to_json({
                 "dataframe_id": dataframe_id,
                 "column": column,
                 "value_counts": value_counts,
                 "total_values": len(df[column]),
                 "unique_values": len(value_counts),
                 "status": "success"
-            }, indent=2)
+            })
 
         elif unique:
-            # Get unique values
-            unique_values = df[column].unique().tolist()
-
-            # Convert non-serializable values to strings if necessary
-            unique_values = [str(v) if not isinstance(
-                v, (int, float, bool, str, type(None))) else v for v in unique_values]
+            # Get unique values from categorical codes or with Arrow's hash
+            # kernel when possible
+            series = df[column]
+            arr = None
+            if xlsx and not isinstance(series.dtype, xlsx.pandas.CategoricalDtype):
+                arr = xlsx._arrow_array(series)
+            if arr is not None:
+                unique_values = xlsx.pyarrow.compute.unique(arr).to_pylist()
+            else:
+                unique_values = series.unique().tolist()
 
-            return json.dumps({
+            return _to_json({
                 "dataframe_id": dataframe_id,
                 "column": column,
                 "unique_values": unique_values,
                 "count": len(unique_values),
                 "status": "success"
-            }, indent=2)
+            })
 
         else:
-            # Get all values
-            values = df[column].tolist()
-
-            # Convert non-serializable values to strings if necessary
-            values = [str(v) if not isinstance(
-                v, (int, float, bool, str, type(None))) else v for v in values]
+            # Get up to limit values, converting only that slice to Python.
+            # orjson writes plain NumPy numeric arrays directly, NaN as null
+            import numpy as np
+
+            series = df[column]
+            if (orjson is not None and isinstance(series.dtype, np.dtype)
+                    and series.dtype.kind in "iufb"):
+                values = np.ascontiguousarray(series.to_numpy()[:limit])
+            else:
+                arr = xlsx._arrow_array(series) if xlsx else None
+                if arr is not None:
+                    values = arr.slice(0, limit).to_pylist()
+                else:
+                    values = series.iloc[:limit].tolist()
 
-            return json.dumps({
+            return _to_json({
                 "dataframe_id": dataframe_id,
                 "column": column,
                 "values": values,
                 "count": len(values),
+                "total_count": len(df),
                 "status": "success"
-            }, indent=2)
+            })
 
     except Exception as e:
-        return json.dumps({"error": f"Error getting column values: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error getting column values: {str(e)}"})
 
 
-async def xlsx_get_correlation(dataframe_id: str, method: str = "pearson", ctx: Context = None) -> str:
+def xlsx_get_correlation(dataframe_id: str, method: str = "pearson", ctx: Context = None) -> str:
     """Get correlation matrix for a DataFrame
 
     Parameters:
@@ -1595,24 +2628,34 @@ async def xlsx_get_correlation(dataframe_id: str, method: str = "pearson", ctx:
     Returns:
     - JSON string with the correlation matrix
     """
+    xlsx = _get_xlsx_service()
+    if not xlsx:
+        return "XlsxWriter service not properly initialized. Check if pandas and xlsxwriter libraries are installed."
+
     try:
-        # Get DataFrame from memory
-        df = _get_dataframe(dataframe_id)
-        if df is None:
-            return json.dumps({"error": f"DataFrame with ID '{dataframe_id}' not found"}, indent=2)
+        if dataframe_id not in _dataframe_registry:
+            return _to_json({"error": f"DataFrame with ID '{dataframe_id}' not found"})
 
-        # Calculate correlation matrix
-        corr = df.corr(method=method).round(4).to_dict()
+        # Calculate correlation matrix, once per method for each stored frame
+        key = ("correlation", method)
+        corr = _stats_cache.get(dataframe_id, {}).get(key)
+        if corr is None:
+            corr = xlsx.correlation(_get_dataframe(dataframe_id), method=method)
 
-        return json.dumps({
+            if isinstance(corr, dict) and "error" in corr:
+                return _to_json(corr)
+
+            _stats_cache.setdefault(dataframe_id, {})[key] = corr
+
+        return _to_json({
             "dataframe_id": dataframe_id,
             "correlation_matrix": corr,
             "method": method,
             "status": "success"
-        }, indent=2)
+        })
 
     except Exception as e:
-        return json.dumps({"error": f"Error calculating correlation: {str(e)}"}, indent=2)
+        return _to_json({"error": f"Error calculating correlation: {str(e)}"})
 
 
 # Tool registration and initialization
@@ -1634,8 +2677,13 @@ def _get_xlsx_service():
     return _xlsx_service
 
 
+@functools.lru_cache(maxsize=1)
 def get_xlsx_tools():
-    """Get a dictionary of all XlsxWriter tools for registration with MCP"""
+    """Get a dictionary of all XlsxWriter tools for registration with MCP
+
+    The dictionary is built once and shared between callers, so it must not
+    be modified.
+    """
     return {
         # Existing tools
         XlsxWriterTools.CREATE_WORKBOOK: xlsx_create_workbook,
@@ -1643,6 +2691,7 @@ def get_xlsx_tools():
         XlsxWriterTools.WRITE_DATA: xlsx_write_data,
         XlsxWriterTools.WRITE_MATRIX: xlsx_write_matrix,
         XlsxWriterTools.ADD_FORMAT: xlsx_add_format,
+        XlsxWriterTools.ADD_FORMATS: xlsx_add_formats,
         XlsxWriterTools.ADD_CHART: xlsx_add_chart,
         XlsxWriterTools.ADD_IMAGE: xlsx_add_image,
         XlsxWriterTools.ADD_FORMULA: xlsx_add_formula,
@@ -1683,28 +2732,17 @@ def initialize(mcp=None):
     # Initialize the service
     service = initialize_xlsx_service()
 
-    # Check for required dependencies
-    missing_deps = []
-    try:
-        import xlsxwriter
-    except ImportError:
-        missing_deps.append("xlsxwriter")
-
-    try:
-        import pandas
-    except ImportError:
-        missing_deps.append("pandas")
+    # Check for dependencies without importing them; the service imports
+    # each library the first time a tool needs it
+    missing_deps = [name for name in ("xlsxwriter", "pandas")
+                    if importlib.util.find_spec(name) is None]
 
-    try:
-        import openpyxl
-    except ImportError:
+    if importlib.util.find_spec("openpyxl") is None:
         # Optional but recommended
         logging.warning(
             "openpyxl not installed. Some Excel reading features may be limited.")
 
-    try:
-        import xlrd
-    except ImportError:
+    if importlib.util.find_spec("xlrd") is None:
         # Optional but recommended for older Excel formats
         logging.warning(
             "xlrd not installed. Reading older Excel formats may be limited.")
@@ -1714,7 +2752,7 @@ def initialize(mcp=None):
             f"Missing required dependencies: {', '.join(missing_deps)}. Please install them.")
         return False
 
-    if service and service.initialized and service.pandas_available:
+    if service:
         logging.info(
             "XlsxWriter service initialized successfully with pandas support")
         return True
@@ -0,0 +1,29 @@
+"""JSON serialization shared by the tool modules."""
+import json
+from typing import Any
+
+# orjson is optional but encodes large tool responses several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def to_json(result: Any, indent: bool = False) -> str:
+    """Serialize a tool result as JSON, using orjson when available.
+
+    Output is compact unless indent is set. NumPy values and non-string dict
+    keys are accepted; other unsupported values are written with str().
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(result, option=option).decode()
+        except TypeError:
+            # Fall back for types orjson does not handle
+            pass
+    if indent:
+        return json.dumps(result, indent=2, default=str)
+    return json.dumps(result, separators=(",", ":"), default=str)
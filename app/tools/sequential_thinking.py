@@ -61,18 +61,17 @@ class SequentialThinkingService:
 │ {t.thought.ljust(len(border) - 2)} │
 └{border}┘"""
 
-    async def process_thought(self,
-                              thought: str,
-                              thoughtNumber: int,
-                              totalThoughts: int,
-                              nextThoughtNeeded: bool,
-                              isRevision: Optional[bool] = None,
-                              revisesThought: Optional[int] = None,
-                              branchFromThought: Optional[int] = None,
-                              branchId: Optional[str] = None,
-                              needsMoreThoughts: Optional[bool] = None,
-                              ctx: Context = None
-                              ) -> str:
+    def process_thought(self,
+                        thought: str,
+                        thoughtNumber: int,
+                        totalThoughts: int,
+                        nextThoughtNeeded: bool,
+                        isRevision: Optional[bool] = None,
+                        revisesThought: Optional[int] = None,
+                        branchFromThought: Optional[int] = None,
+                        branchId: Optional[str] = None,
+                        needsMoreThoughts: Optional[bool] = None
+                        ) -> str:
         """Process a thought"""
         try:
             # Create thought data
@@ -97,10 +96,6 @@ class SequentialThinkingService:
                     self.branches[thought_data.branchId] = []
                 self.branches[thought_data.branchId].append(thought_data)
 
-            # Print pretty formatted thought to stderr (useful for debugging)
-            if ctx:
-                ctx.info(self.format_thought(thought_data))
-
             # Return result
             return json.dumps({
                 "thoughtNumber": thought_data.thoughtNumber,
@@ -143,7 +138,10 @@ async def sequential_thinking(
     - Problems where the full scope might not be clear initially
     """
     try:
-        return await _get_thinking_service().process_thought(
+        # Recording a thought is pure CPU work, so the service call is sync
+        service = _get_thinking_service()
+        history_length = len(service.thought_history)
+        result = service.process_thought(
             thought,
             thoughtNumber,
             totalThoughts,
@@ -152,9 +150,14 @@ async def sequential_thinking(
             revisesThought,
             branchFromThought,
             branchId,
-            needsMoreThoughts,
-            ctx
+            needsMoreThoughts
         )
+
+        # Log the pretty formatted thought to the client (useful for debugging)
+        if ctx and len(service.thought_history) > history_length:
+            await ctx.info(service.format_thought(service.thought_history[-1]))
+
+        return result
     except Exception as e:
         return json.dumps({
             "error": str(e),
@@ -2,6 +2,7 @@
 import os
 import json
 import logging
+import functools
 import time
 import asyncio
 from enum import Enum
@@ -11,6 +12,8 @@ from urllib.parse import urljoin
 # Ensure compatibility with mcp server
 from mcp.server.fastmcp import FastMCP, Context
 
+from app.tools.json_utils import to_json
+
 # External MCP reference for tool registration
 external_mcp = None
 
@@ -67,6 +70,15 @@ class ShopifyService:
         self.last_request_time = 0
         self.min_request_interval = 0.5  # 500ms minimum between requests
 
+        # Retries for throttled (429) and transient server error responses
+        self.max_retries = 3
+        self.retry_backoff = 1.0  # seconds, doubled after each attempt
+        self.max_retry_delay = 30.0  # longest Retry-After wait honoured
+
+        # Shared HTTP client, created on first request for the running loop
+        self._client = None
+        self._client_loop = None
+
         # Request headers
         self.headers = self._get_headers()
 
@@ -94,6 +106,63 @@ class ShopifyService:
             return (self.api_key, self.api_password)
         return None
 
+    def _get_client(self):
+        """Get the keep-alive HTTP client shared by all requests on this event loop"""
+        import httpx
+
+        # Pooled connections belong to the loop that opened them
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            self._release_client()
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=16, keepalive_expiry=30))
+            self._client_loop = loop
+        return self._client
+
+    def _release_client(self):
+        """Close the shared client on the loop that owns its connections"""
+        client, loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        # A closed loop can't run aclose(); its sockets are freed with the client
+        if client is not None and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def close(self):
+        """Close the shared HTTP client and its pooled connections"""
+        if self._client is None:
+            return
+        if self._client_loop is asyncio.get_running_loop():
+            client = self._client
+            self._client = None
+            self._client_loop = None
+            await client.aclose()
+        else:
+            self._release_client()
+
+    def _should_retry(self, method, response):
+        """Check whether a failed response is worth retrying"""
+        # Throttled requests were never processed, so any method can be resent
+        if response.status_code == 429:
+            return True
+        # A 5xx POST may have created the resource, so only repeat idempotent calls
+        return response.status_code in (500, 502, 503, 504) and method != "post"
+
+    def _retry_delay(self, response, attempt):
+        """Seconds to wait before retrying, honouring Shopify's Retry-After header
+
+        Waits longer than max_retry_delay fall back to the backoff schedule so
+        one throttled call can't block a tool for minutes.
+        """
+        try:
+            delay = float(response.headers["Retry-After"])
+            if 0 <= delay <= self.max_retry_delay:
+                return delay
+        except (KeyError, ValueError):
+            pass
+        return self.retry_backoff * 2 ** attempt
+
     async def _make_request(self, method, endpoint, params=None, data=None, json_data=None):
         """Make a rate-limited request to Shopify API"""
         # Basic rate limiting
@@ -105,35 +174,38 @@ class ShopifyService:
         url = urljoin(self.base_url, endpoint)
         auth = self._get_auth()
 
-        import httpx
-        async with httpx.AsyncClient() as client:
-            self.last_request_time = time.time()
+        method = method.lower()
+        if method not in ("get", "post", "put", "delete"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
 
-            if method.lower() == "get":
-                response = await client.get(url, params=params, headers=self.headers, auth=auth)
-            elif method.lower() == "post":
-                response = await client.post(url, params=params, json=json_data, headers=self.headers, auth=auth)
-            elif method.lower() == "put":
-                response = await client.put(url, params=params, json=json_data, headers=self.headers, auth=auth)
-            elif method.lower() == "delete":
-                response = await client.delete(url, params=params, headers=self.headers, auth=auth)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            # Check for Shopify API response errors
-            if response.status_code >= 400:
-                error_msg = f"Shopify API error: {response.status_code}"
-                try:
-                    error_detail = response.json()
-                    error_msg += f" - {json.dumps(error_detail)}"
-                except:
-                    error_msg += f" - {response.text}"
-                raise Exception(error_msg)
-
-            # Parse response if it has content
-            if response.status_code != 204 and response.content:  # No content
-                return response.json()
-            return None
+        # Reusing one client keeps the TLS connection to the shop alive
+        # between calls instead of handshaking for every request
+        client = self._get_client()
+        for attempt in range(self.max_retries + 1):
+            self.last_request_time = time.time()
+            response = await client.request(
+                method.upper(), url, params=params,
+                json=json_data if method in ("post", "put") else None,
+                headers=self.headers, auth=auth)
+
+            if attempt == self.max_retries or not self._should_retry(method, response):
+                break
+            await asyncio.sleep(self._retry_delay(response, attempt))
+
+        # Check for Shopify API response errors
+        if response.status_code >= 400:
+            error_msg = f"Shopify API error: {response.status_code}"
+            try:
+                error_detail = response.json()
+                error_msg += f" - {json.dumps(error_detail)}"
+            except:
+                error_msg += f" - {response.text}"
+            raise Exception(error_msg)
+
+        # Parse response if it has content
+        if response.status_code != 204 and response.content:  # No content
+            return response.json()
+        return None
 
     # Product operations
     async def get_products(self, limit=50, page_info=None, collection_id=None, product_type=None, vendor=None):
@@ -296,9 +368,29 @@ class ShopifyService:
             return await self._make_request("put", f"smart_collections/{collection_id}.json",
                                             json_data={"smart_collection": collection_data})
 
+
+# Tool responses are indented JSON
+_to_json = functools.partial(to_json, indent=True)
+
+
+def _shopify_tool(error_message):
+    """Check configuration, serialize the result and report exceptions for a Shopify tool"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not _get_shopify_service():
+                return "Shopify API is not configured. Please set the required environment variables."
+            try:
+                return _to_json(await func(*args, **kwargs))
+            except Exception as e:
+                return f"{error_message}: {str(e)}"
+        return wrapper
+    return decorator
+
 # Tool function implementations
 
 
+@_shopify_tool("Error retrieving products")
 async def shopify_get_products(limit: int = 50, page_info: str = None,
                                collection_id: str = None, product_type: str = None,
                                vendor: str = None, ctx: Context = None) -> str:
@@ -311,34 +403,20 @@ async def shopify_get_products(limit: int = 50, page_info: str = None,
     - product_type: Filter by product type
     - vendor: Filter by vendor name
     """
-    shopify = _get_shopify_service()
-    if not shopify:
-        return "Shopify API is not configured. Please set the required environment variables."
-
-    try:
-        result = await shopify.get_products(limit, page_info, collection_id, product_type, vendor)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving products: {str(e)}"
+    return await _get_shopify_service().get_products(limit, page_info, collection_id, product_type, vendor)
 
 
+@_shopify_tool("Error retrieving product")
 async def shopify_get_product(product_id: str, ctx: Context = None) -> str:
     """Get a specific product by ID
 
     Parameters:
     - product_id: The ID of the product to retrieve
     """
-    shopify = _get_shopify_service()
-    if not shopify:
-        return "Shopify API is not configured. Please set the required environment variables."
-
-    try:
-        result = await shopify.get_product(product_id)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving product: {str(e)}"
+    return await _get_shopify_service().get_product(product_id)
 
 
+@_shopify_tool("Error creating product")
 async def shopify_create_product(title: str, product_type: str = None,
                                  vendor: str = None, body_html: str = None,
                                  variants: List[Dict] = None, images: List[Dict] = None,
@@ -354,37 +432,29 @@ async def shopify_create_product(title: str, product_type: str = None,
     - images: List of image objects
     - tags: Comma-separated list of tags
     """
-    shopify = _get_shopify_service()
-    if not shopify:
-        return "Shopify API is not configured. Please set the required environment variables."
+    product_data = {
+        "title": title
+    }
 
-    try:
-        product_data = {
-            "title": title
-        }
+    if product_type:
+        product_data["product_type"] = product_type
 
-        if product_type:
-            product_data["product_type"] = product_type
-
-        if vendor:
-            product_data["vendor"] = vendor
+    if vendor:
+        product_data["vendor"] = vendor
 
-        if body_html:
-            product_data["body_html"] = body_html
+    if body_html:
+        product_data["body_html"] = body_html
 
-        if variants:
-            product_data["variants"] = variants
+    if variants:
+        product_data["variants"] = variants
 
-        if images:
-            product_data["images"] = images
+    if images:
+        product_data["images"] = images
 
-        if tags:
-            product_data["tags"] = tags
+    if tags:
+        product_data["tags"] = tags
 
-        result = await shopify.create_product(product_data)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error creating product: {str(e)}"
+    return await _get_shopify_service().create_product(product_data)
 
 # Remaining tool function implementations follow the same pattern
 # I've included just a few examples for brevity - in a real implementation,
@@ -431,6 +501,8 @@ def initialize_shopify_service(shop_domain=None, api_version=None, api_key=None,
             "Shopify credentials not configured. Please set either SHOPIFY_ACCESS_TOKEN or both SHOPIFY_API_KEY and SHOPIFY_API_PASSWORD environment variables.")
         return None
 
+    if _shopify_service is not None:
+        _shopify_service._release_client()
     _shopify_service = ShopifyService(
         shop_domain, api_version, api_key, api_password, access_token)
     return _shopify_service
@@ -1,25 +1,45 @@
 #!/usr/bin/env python3
 """Time tools for timezone conversion and current time retrieval."""
-import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Callable
+import functools
+from datetime import datetime, time as dt_time
+from typing import Dict, List, Callable, TypedDict
 from zoneinfo import ZoneInfo
-from pydantic import BaseModel
 import logging
 
 from app.tools.base_tool import BaseTool
+from app.tools.json_utils import to_json
 from mcp.server.fastmcp import Context
 
 logger = logging.getLogger(__name__)
 
 
-class TimeResult(BaseModel):
+@functools.lru_cache(maxsize=512)
+def _zoneinfo(timezone_name: str) -> ZoneInfo:
+    """Return a shared ZoneInfo so repeated lookups skip the tzdata parse."""
+    return ZoneInfo(timezone_name)
+
+
+def _parse_hhmm(value: str) -> dt_time:
+    """Parse a 24-hour HH:MM string without going through strptime."""
+    hour, sep, minute = value.partition(":")
+    if (sep and 0 < len(hour) <= 2 and 0 < len(minute) <= 2
+            and hour.isdigit() and minute.isdigit()):
+        try:
+            return dt_time(int(hour), int(minute))
+        except ValueError:
+            pass
+    raise ValueError("Invalid time format. Expected HH:MM [24-hour format]")
+
+
+# Plain TypedDicts: every field is built here from trusted values, so
+# validating them again through pydantic would only add overhead
+class TimeResult(TypedDict):
     timezone: str
     datetime: str
     is_dst: bool
 
 
-class TimeConversionResult(BaseModel):
+class TimeConversionResult(TypedDict):
     source: TimeResult
     target: TimeResult
     time_difference: str
@@ -38,7 +58,7 @@ class TimeTools(BaseTool):
         return "Tools for getting current time in different timezones and converting time between timezones"
         
     def get_dependencies(self) -> List[str]:
-        return ["pydantic"]
+        return []
         
     def get_tools(self) -> Dict[str, Callable]:
         return {
@@ -49,7 +69,7 @@ class TimeTools(BaseTool):
     def _get_zoneinfo(self, timezone_name: str) -> ZoneInfo:
         """Get ZoneInfo object for a timezone name."""
         try:
-            return ZoneInfo(timezone_name)
+            return _zoneinfo(timezone_name)
         except Exception as e:
             raise ValueError(f"Invalid timezone: {str(e)}")
             
@@ -72,9 +92,9 @@ class TimeTools(BaseTool):
                 is_dst=bool(current_time.dst()),
             )
             
-            return json.dumps(result.model_dump(), indent=2)
+            return to_json(result)
         except Exception as e:
-            logger.error(f"Error getting current time: {str(e)}")
+            logger.error("Error getting current time: %s", e)
             return f"Error processing time query: {str(e)}"
             
     async def convert_time(self, source_timezone: str, time: str, target_timezone: str, ctx: Context = None) -> str:
@@ -93,35 +113,29 @@ class TimeTools(BaseTool):
             target_timezone_obj = self._get_zoneinfo(target_timezone)
             
             # Parse time
-            try:
-                parsed_time = datetime.strptime(time, "%H:%M").time()
-            except ValueError:
-                raise ValueError("Invalid time format. Expected HH:MM [24-hour format]")
-                
+            parsed_time = _parse_hhmm(time)
+
             # Create datetime objects
             now = datetime.now(source_timezone_obj)
-            source_time = datetime(
-                now.year,
-                now.month,
-                now.day,
-                parsed_time.hour,
-                parsed_time.minute,
-                tzinfo=source_timezone_obj,
-            )
+            source_time = datetime.combine(now.date(), parsed_time, tzinfo=source_timezone_obj)
             
-            # Convert to target timezone
+            # Convert to target timezone. astimezone resolves the target offset
+            # for this instant; shifting by today's offsets would be off by an
+            # hour whenever the two zones straddle a DST change
             target_time = source_time.astimezone(target_timezone_obj)
             
-            # Calculate time difference
-            source_offset = source_time.utcoffset() or timedelta()
-            target_offset = target_time.utcoffset() or timedelta()
-            hours_difference = (target_offset - source_offset).total_seconds() / 3600
+            # Calculate time difference. Both datetimes carry a ZoneInfo, so
+            # utcoffset() never returns None and needs no fallback
+            source_offset = source_time.utcoffset()
+            target_offset = target_time.utcoffset()
+            diff_seconds = int((target_offset - source_offset).total_seconds())
             
-            if hours_difference.is_integer():
-                time_diff_str = f"{hours_difference:+.1f}h"
+            if diff_seconds % 3600 == 0:
+                # Whole hours cover almost every zone pair; stay in integer math
+                time_diff_str = f"{diff_seconds // 3600:+d}.0h"
             else:
                 # For fractional hours like Nepal's UTC+5:45
-                time_diff_str = f"{hours_difference:+.2f}".rstrip("0").rstrip(".") + "h"
+                time_diff_str = f"{diff_seconds / 3600:+.2f}".rstrip("0").rstrip(".") + "h"
                 
             result = TimeConversionResult(
                 source=TimeResult(
@@ -137,7 +151,7 @@ class TimeTools(BaseTool):
                 time_difference=time_diff_str,
             )
             
-            return json.dumps(result.model_dump(), indent=2)
+            return to_json(result)
         except Exception as e:
-            logger.error(f"Error converting time: {str(e)}")
+            logger.error("Error converting time: %s", e)
             return f"Error processing time conversion: {str(e)}"
\ No newline at end of file
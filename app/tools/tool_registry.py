@@ -1,8 +1,10 @@
 """Dynamic tool registration system for MCP tools."""
 import os
 import sys
+import functools
 import importlib
 import inspect
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Type, Optional
 import logging
@@ -11,6 +13,27 @@ from mcp.server.fastmcp import FastMCP
 
 logger = logging.getLogger(__name__)
 
+# Modules in the tools directory that hold registry plumbing, not tools
+_NON_TOOL_FILES = frozenset({"base_tool.py", "tool_registry.py"})
+
+
+@functools.lru_cache(maxsize=None)
+def _find_tool_classes(module) -> tuple:
+    """Return the BaseTool subclasses defined or imported in a module.
+
+    Reads the module namespace directly instead of inspect.getmembers, which
+    resolves every attribute through getattr. Names are still visited in
+    sorted order so the first-match fallback picks the same class as before.
+    """
+    return tuple(obj for _, obj in sorted(vars(module).items())
+                 if isinstance(obj, type) and issubclass(obj, BaseTool) and obj is not BaseTool)
+
+
+@functools.lru_cache(maxsize=None)
+def _signature(func) -> inspect.Signature:
+    """Memoized inspect.signature for legacy initialize functions."""
+    return inspect.signature(func)
+
 
 class ToolRegistry:
     """Registry for dynamically loading and managing MCP tools."""
@@ -25,16 +48,13 @@ class ToolRegistry:
         
         Returns a list of module names that potentially contain tools.
         """
-        tool_modules = []
-        
-        for file in tools_dir.glob("*.py"):
-            if file.name.startswith("_") or file.name in ["base_tool.py", "tool_registry.py"]:
-                continue
-                
-            module_name = file.stem
-            tool_modules.append(module_name)
-            
-        return tool_modules
+        # scandir hands back names straight from the directory listing, without
+        # building a Path and matching a glob pattern for every entry
+        with os.scandir(tools_dir) as entries:
+            return [entry.name[:-3] for entry in entries
+                    if entry.name.endswith(".py")
+                    and not entry.name.startswith("_")
+                    and entry.name not in _NON_TOOL_FILES]
         
     def load_tool_module(self, module_name: str) -> Optional[Type[BaseTool]]:
         """Load a tool module and return its tool class if it exists.
@@ -46,12 +66,7 @@ class ToolRegistry:
             module = importlib.import_module(f"app.tools.{module_name}")
             
             # Find classes that inherit from BaseTool
-            tool_classes = []
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
-                    issubclass(obj, BaseTool) and 
-                    obj is not BaseTool):
-                    tool_classes.append(obj)
+            tool_classes = _find_tool_classes(module)
                     
             if len(tool_classes) == 1:
                 return tool_classes[0]
@@ -82,6 +97,13 @@ class ToolRegistry:
                 super().__init__()
                 self.module = module
                 self.module_name = module_name
+                # Resolve the module's tool getter once; get_tools() is called
+                # at registration and again for every status report
+                candidates = (f'get_{module_name}_tools',
+                              f'get_{module_name.replace("_", "")}_tools',
+                              'get_tools')
+                self._tools_fn = next((getattr(module, func_name) for func_name in candidates
+                                       if hasattr(module, func_name)), None)
                 
             def get_name(self) -> str:
                 return self.module_name.replace("_", " ").title()
@@ -90,13 +112,7 @@ class ToolRegistry:
                 return f"Legacy tool: {self.module_name}"
                 
             def get_tools(self) -> Dict[str, callable]:
-                # Try different function name patterns
-                for func_name in [f'get_{self.module_name}_tools', 
-                                 f'get_{self.module_name.replace("_", "")}_tools',
-                                 'get_tools']:
-                    if hasattr(self.module, func_name):
-                        return getattr(self.module, func_name)()
-                return {}
+                return self._tools_fn() if self._tools_fn else {}
                 
             def get_dependencies(self) -> List[str]:
                 # Try to extract dependencies from module
@@ -113,7 +129,7 @@ class ToolRegistry:
                 if hasattr(self.module, 'initialize'):
                     # Handle different initialize signatures
                     init_func = self.module.initialize
-                    sig = inspect.signature(init_func)
+                    sig = _signature(init_func)
                     if len(sig.parameters) == 0:
                         init_func()
                     elif 'mcp' in sig.parameters:
@@ -191,8 +207,6 @@ class ToolRegistry:
         
         Returns a dictionary mapping tool names to registration success status.
         """
-        results = {}
-        
         # Import config functions if config is provided
         if config:
             from config_loader import is_tool_enabled, get_tool_config
@@ -200,16 +214,29 @@ class ToolRegistry:
         # Discover tool modules
         tool_modules = self.discover_tools(tools_dir)
         logger.info(f"Discovered {len(tool_modules)} potential tool modules")
+        # Pre-filled so results keep discovery order despite concurrent loading
+        results = dict.fromkeys(tool_modules, False)
         
-        # Load and register each tool
+        # Check which tools are enabled in config
+        enabled_modules = []
         for module_name in tool_modules:
-            # Check if tool is enabled in config
             if config and not is_tool_enabled(config, module_name):
                 logger.info(f"Tool {module_name} is disabled in configuration")
                 results[module_name] = False
-                continue
+            else:
+                enabled_modules.append(module_name)
                 
-            tool_class = self.load_tool_module(module_name)
+        # Importing the modules (and their SDKs) dominates startup, so load
+        # them concurrently. Registration stays serial below because some
+        # legacy initialize() functions add tools to the shared FastMCP
+        # instance themselves.
+        with ThreadPoolExecutor(max_workers=min(32, len(enabled_modules) or 1)) as pool:
+            tool_classes = dict(zip(enabled_modules,
+                                    pool.map(self.load_tool_module, enabled_modules)))
+        
+        # Register each tool
+        for module_name in enabled_modules:
+            tool_class = tool_classes[module_name]
             if tool_class:
                 # Get tool-specific config
                 tool_config = get_tool_config(config, module_name) if config else {}
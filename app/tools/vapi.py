@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 import os
-import json
 import logging
+import functools
+import importlib.util
 from typing import List, Dict, Optional, Any, Union, Tuple
 from enum import Enum
 import asyncio
@@ -9,6 +10,8 @@ import asyncio
 # Ensure compatibility with mcp server
 from mcp.server.fastmcp import FastMCP, Context
 
+from app.tools.json_utils import to_json
+
 # External MCP reference for tool registration
 external_mcp = None
 
@@ -33,6 +36,22 @@ class VAPITools(str, Enum):
     SEND_EVENT = "vapi_send_event"
 
 
+def _vapi_call(action):
+    """Check initialization and turn exceptions into {"error": ...} for a VAPIService method"""
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                self._is_initialized()
+                return await method(self, *args, **kwargs)
+            except Exception as e:
+                error_msg = f"Error {action}: {str(e)}"
+                logging.error(error_msg)
+                return {"error": error_msg}
+        return wrapper
+    return decorator
+
+
 class VAPIService:
     """Service to handle VAPI operations"""
     
@@ -59,172 +78,124 @@ class VAPIService:
             raise ValueError("VAPI service not properly initialized. Check if vapi library is installed.")
         return True
 
+    @_vapi_call("making call")
     async def make_call(self, to: str, assistant_id: str, 
                         from_number: Optional[str] = None,
                         assistant_options: Optional[Dict[str, Any]] = None,
                         server_url: Optional[str] = None) -> Dict[str, Any]:
         """Make a call using VAPI"""
-        try:
-            self._is_initialized()
-            
-            # Prepare call parameters
-            params = {
-                "to": to,
-                "assistant_id": assistant_id
-            }
+        # Prepare call parameters
+        params = {
+            "to": to,
+            "assistant_id": assistant_id
+        }
+        
+        # Add optional parameters if provided
+        if from_number:
+            params["from"] = from_number
+        if assistant_options:
+            params["options"] = assistant_options
+        if server_url:
+            params["server_url"] = server_url
             
-            # Add optional parameters if provided
-            if from_number:
-                params["from"] = from_number
-            if assistant_options:
-                params["options"] = assistant_options
-            if server_url:
-                params["server_url"] = server_url
-                
-            # Make the API call
-            call = self.client.calls.create(**params)
-            return call
-        except Exception as e:
-            error_msg = f"Error making call: {str(e)}"
-            logging.error(error_msg)
-            return {"error": error_msg}
+        # Make the API call
+        call = self.client.calls.create(**params)
+        return call
 
+    @_vapi_call("listing calls")
     async def list_calls(self, 
                          limit: Optional[int] = 10, 
                          before: Optional[str] = None,
                          after: Optional[str] = None,
                          status: Optional[str] = None) -> Dict[str, Any]:
         """List calls from VAPI"""
-        try:
-            self._is_initialized()
+        # Prepare parameters
+        params = {}
+        if limit:
+            params["limit"] = limit
+        if before:
+            params["before"] = before
+        if after:
+            params["after"] = after
+        if status:
+            params["status"] = status
             
-            # Prepare parameters
-            params = {}
-            if limit:
-                params["limit"] = limit
-            if before:
-                params["before"] = before
-            if after:
-                params["after"] = after
-            if status:
-                params["status"] = status
-                
-            # Make the API call
-            calls = self.client.calls.list(**params)
-            return calls
-        except Exception as e:
-            error_msg = f"Error listing calls: {str(e)}"
-            logging.error(error_msg)
-            return {"error": error_msg}
+        # Make the API call
+        calls = self.client.calls.list(**params)
+        return calls
 
+    @_vapi_call("getting call details")
     async def get_call(self, call_id: str) -> Dict[str, Any]:
         """Get details of a specific call"""
-        try:
-            self._is_initialized()
-            
-            # Make the API call
-            call = self.client.calls.get(call_id)
-            return call
-        except Exception as e:
-            error_msg = f"Error getting call details: {str(e)}"
-            logging.error(error_msg)
-            return {"error": error_msg}
+        # Make the API call
+        call = self.client.calls.get(call_id)
+        return call
 
+    @_vapi_call("ending call")
     async def end_call(self, call_id: str) -> Dict[str, Any]:
         """End a call"""
-        try:
-            self._is_initialized()
-            
-            # Make the API call
-            result = self.client.calls.end(call_id)
-            return result
-        except Exception as e:
-            error_msg = f"Error ending call: {str(e)}"
-            logging.error(error_msg)
-            return {"error": error_msg}
+        # Make the API call
+        result = self.client.calls.end(call_id)
+        return result
 
+    @_vapi_call("getting call recordings")
     async def get_recordings(self, call_id: str) -> Dict[str, Any]:
         """Get recordings for a call"""
-        try:
-            self._is_initialized()
-            
-            # Make the API call
-            recordings = self.client.calls.recordings(call_id)
-            return recordings
-        except Exception as e:
-            error_msg = f"Error getting call recordings: {str(e)}"
-            logging.error(error_msg)
-            return {"error": error_msg}
+        # Make the API call
+        recordings = self.client.calls.recordings(call_id)
+        return recordings
 
+    @_vapi_call("adding human to call")
     async def add_human(self, call_id: str, 
                         phone_number: str = None,
                         transfer: bool = False) -> Dict[str, Any]:
         """Add a human to a call"""
-        try:
-            self._is_initialized()
+        # Prepare parameters
+        params = {}
+        if phone_number:
+            params["phone_number"] = phone_number
+        if transfer is not None:
+            params["transfer"] = transfer
             
-            # Prepare parameters
-            params = {}
-            if phone_number:
-                params["phone_number"] = phone_number
-            if transfer is not None:
-                params["transfer"] = transfer
-                
-            # Make the API call
-            result = self.client.calls.add_human(call_id, **params)
-            return result
-        except Exception as e:
-            error_msg = f"Error adding human to call: {str(e)}"
-            logging.error(error_msg)
-            return {"error": error_msg}
+        # Make the API call
+        result = self.client.calls.add_human(call_id, **params)
+        return result
 
+    @_vapi_call("pausing call")
     async def pause_call(self, call_id: str) -> Dict[str, Any]:
         """Pause a call"""
-        try:
-            self._is_initialized()
-            
-            # Make the API call
-            result = self.client.calls.pause(call_id)
-            return result
-        except Exception as e:
-            error_msg = f"Error pausing call: {str(e)}"
-            logging.error(error_msg)
-            return {"error": error_msg}
+        # Make the API call
+        result = self.client.calls.pause(call_id)
+        return result
 
+    @_vapi_call("resuming call")
     async def resume_call(self, call_id: str) -> Dict[str, Any]:
         """Resume a paused call"""
-        try:
-            self._is_initialized()
-            
-            # Make the API call
-            result = self.client.calls.resume(call_id)
-            return result
-        except Exception as e:
-            error_msg = f"Error resuming call: {str(e)}"
-            logging.error(error_msg)
-            return {"error": error_msg}
+        # Make the API call
+        result = self.client.calls.resume(call_id)
+        return result
 
+    @_vapi_call("sending event to call")
     async def send_event(self, call_id: str, 
                           event_type: str, 
                           data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Send an event to a call"""
-        try:
-            self._is_initialized()
+        # Prepare parameters
+        params = {
+            "type": event_type
+        }
+        if data:
+            params["data"] = data
             
-            # Prepare parameters
-            params = {
-                "type": event_type
-            }
-            if data:
-                params["data"] = data
-                
-            # Make the API call
-            result = self.client.calls.send_event(call_id, params)
-            return result
-        except Exception as e:
-            error_msg = f"Error sending event to call: {str(e)}"
-            logging.error(error_msg)
-            return {"error": error_msg}
+        # Make the API call
+        result = self.client.calls.send_event(call_id, params)
+        return result
+
+
+# Tool responses are indented JSON; SDK objects neither encoder handles are
+# stringified. The service methods already turn failures into {"error": ...},
+# so the tool wrappers need no exception handling of their own.
+_to_json = functools.partial(to_json, indent=True)
 
 
 # Tool function definitions that will be registered with MCP
@@ -250,13 +221,9 @@ async def vapi_make_call(to: str, assistant_id: str,
     """
     vapi = _get_vapi_service()
     if not vapi:
-        return json.dumps({"error": "VAPI service not properly initialized."})
+        return _to_json({"error": "VAPI service not properly initialized."})
 
-    try:
-        result = await vapi.make_call(to, assistant_id, from_number, assistant_options, server_url)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": f"Error making call: {str(e)}"}, indent=2)
+    return _to_json(await vapi.make_call(to, assistant_id, from_number, assistant_options, server_url))
 
 
 async def vapi_list_calls(limit: int = 10, 
@@ -279,13 +246,9 @@ async def vapi_list_calls(limit: int = 10,
     """
     vapi = _get_vapi_service()
     if not vapi:
-        return json.dumps({"error": "VAPI service not properly initialized."})
+        return _to_json({"error": "VAPI service not properly initialized."})
 
-    try:
-        result = await vapi.list_calls(limit, before, after, status)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": f"Error listing calls: {str(e)}"}, indent=2)
+    return _to_json(await vapi.list_calls(limit, before, after, status))
 
 
 async def vapi_get_call(call_id: str, ctx: Context = None) -> str:
@@ -301,13 +264,9 @@ async def vapi_get_call(call_id: str, ctx: Context = None) -> str:
     """
     vapi = _get_vapi_service()
     if not vapi:
-        return json.dumps({"error": "VAPI service not properly initialized."})
+        return _to_json({"error": "VAPI service not properly initialized."})
 
-    try:
-        result = await vapi.get_call(call_id)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": f"Error getting call: {str(e)}"}, indent=2)
+    return _to_json(await vapi.get_call(call_id))
 
 
 async def vapi_end_call(call_id: str, ctx: Context = None) -> str:
@@ -323,13 +282,9 @@ async def vapi_end_call(call_id: str, ctx: Context = None) -> str:
     """
     vapi = _get_vapi_service()
     if not vapi:
-        return json.dumps({"error": "VAPI service not properly initialized."})
+        return _to_json({"error": "VAPI service not properly initialized."})
 
-    try:
-        result = await vapi.end_call(call_id)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": f"Error ending call: {str(e)}"}, indent=2)
+    return _to_json(await vapi.end_call(call_id))
 
 
 async def vapi_get_recordings(call_id: str, ctx: Context = None) -> str:
@@ -345,13 +300,9 @@ async def vapi_get_recordings(call_id: str, ctx: Context = None) -> str:
     """
     vapi = _get_vapi_service()
     if not vapi:
-        return json.dumps({"error": "VAPI service not properly initialized."})
+        return _to_json({"error": "VAPI service not properly initialized."})
 
-    try:
-        result = await vapi.get_recordings(call_id)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": f"Error getting recordings: {str(e)}"}, indent=2)
+    return _to_json(await vapi.get_recordings(call_id))
 
 
 async def vapi_add_human(call_id: str, 
@@ -372,13 +323,9 @@ async def vapi_add_human(call_id: str,
     """
     vapi = _get_vapi_service()
     if not vapi:
-        return json.dumps({"error": "VAPI service not properly initialized."})
+        return _to_json({"error": "VAPI service not properly initialized."})
 
-    try:
-        result = await vapi.add_human(call_id, phone_number, transfer)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": f"Error adding human to call: {str(e)}"}, indent=2)
+    return _to_json(await vapi.add_human(call_id, phone_number, transfer))
 
 
 async def vapi_pause_call(call_id: str, ctx: Context = None) -> str:
@@ -394,13 +341,9 @@ async def vapi_pause_call(call_id: str, ctx: Context = None) -> str:
     """
     vapi = _get_vapi_service()
     if not vapi:
-        return json.dumps({"error": "VAPI service not properly initialized."})
+        return _to_json({"error": "VAPI service not properly initialized."})
 
-    try:
-        result = await vapi.pause_call(call_id)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": f"Error pausing call: {str(e)}"}, indent=2)
+    return _to_json(await vapi.pause_call(call_id))
 
 
 async def vapi_resume_call(call_id: str, ctx: Context = None) -> str:
@@ -416,13 +359,9 @@ async def vapi_resume_call(call_id: str, ctx: Context = None) -> str:
     """
     vapi = _get_vapi_service()
     if not vapi:
-        return json.dumps({"error": "VAPI service not properly initialized."})
+        return _to_json({"error": "VAPI service not properly initialized."})
 
-    try:
-        result = await vapi.resume_call(call_id)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": f"Error resuming call: {str(e)}"}, indent=2)
+    return _to_json(await vapi.resume_call(call_id))
 
 
 async def vapi_send_event(call_id: str, 
@@ -443,13 +382,9 @@ async def vapi_send_event(call_id: str,
     """
     vapi = _get_vapi_service()
     if not vapi:
-        return json.dumps({"error": "VAPI service not properly initialized."})
+        return _to_json({"error": "VAPI service not properly initialized."})
 
-    try:
-        result = await vapi.send_event(call_id, event_type, data)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": f"Error sending event to call: {str(e)}"}, indent=2)
+    return _to_json(await vapi.send_event(call_id, event_type, data))
 
 
 # Tool registration and initialization
@@ -504,15 +439,19 @@ def initialize(mcp=None):
     if mcp:
         set_external_mcp(mcp)
 
-    # Initialize the service
-    service = initialize_vapi_service()
-    if service and service.initialized:
-        logging.info("VAPI service initialized successfully")
-        return True
-    else:
+    # Check for the SDK and key without importing vapi; the client is built
+    # on the first tool call, so servers that never place a call skip it
+    if importlib.util.find_spec("vapi") is None:
         logging.warning("Failed to initialize VAPI service. Please ensure vapi is installed and API key is configured.")
         return False
 
+    if not os.environ.get("VAPI_API_KEY"):
+        logging.warning("VAPI API key not configured. Please set the VAPI_API_KEY environment variable.")
+        return False
+
+    logging.info("VAPI service will be initialized on first use")
+    return True
+
 
 if __name__ == "__main__":
     print("VAPI service module - use with MCP Unified Server")
\ No newline at end of file
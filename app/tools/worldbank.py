@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
-import requests
+import asyncio
+import random
+import time
 import pandas as pd
 import logging
+from urllib.parse import quote
 
 # Ensure compatibility with mcp server
 from mcp.server.fastmcp import FastMCP, Context
@@ -17,36 +20,105 @@ def set_external_mcp(mcp):
     logging.info("World Bank tools MCP reference set")
 
 
+def _indicator_url(base_url, country_id, indicator_id):
+    """Build an indicator URL with the ids escaped as path segments"""
+    # ';' is kept so several countries can be requested at once, e.g. "USA;GBR"
+    return (f"{base_url}/country/{quote(country_id, safe=';')}"
+            f"/indicator/{quote(indicator_id, safe='')}")
+
+
 class WorldBankService:
     """Service to handle World Bank API operations"""
 
     def __init__(self):
         self.base_url = "https://api.worldbank.org/v2"
+        # The full indicator list is tens of MB, well past httpx's 5s default
+        self.timeout = 60.0
+        self.max_retries = 3
+        self.retry_backoff = 0.5  # seconds, doubled after each attempt
+        self.max_retry_delay = 30.0  # longest Retry-After wait honoured
+        # After breaker_threshold consecutive failed fetches, fail fast for
+        # breaker_cooldown seconds instead of piling onto a struggling API
+        self.breaker_threshold = 5
+        self.breaker_cooldown = 30.0
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
+
+    def _retry_delay(self, response, attempt):
+        """Seconds to wait before retrying, honouring a Retry-After header
+
+        HTTP-date values and waits longer than max_retry_delay fall back to
+        the backoff schedule.
+        """
+        if response is not None:
+            try:
+                delay = float(response.headers["Retry-After"])
+                if 0 <= delay <= self.max_retry_delay:
+                    return delay
+            except (KeyError, ValueError):
+                pass
+        # Jitter keeps concurrent callers from retrying in lockstep
+        return self.retry_backoff * 2 ** attempt * random.uniform(0.5, 1.5)
+
+    def _record_result(self, ok):
+        """Update the circuit breaker after a fetch"""
+        if ok:
+            self._consecutive_failures = 0
+            return
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.breaker_threshold:
+            self._breaker_open_until = time.monotonic() + self.breaker_cooldown
+
+    async def _get_json(self, url, params):
+        """Fetch a URL without blocking the event loop and parse the JSON body
+
+        Connection errors, 429 and 5xx responses are retried with exponential
+        backoff; all requests here are GETs, so repeating them is safe.
+        """
+        import httpx
 
-    def get_countries(self):
+        if time.monotonic() < self._breaker_open_until:
+            raise RuntimeError("World Bank API unavailable after repeated failures, try again shortly")
+
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            for attempt in range(self.max_retries + 1):
+                response = None
+                try:
+                    response = await client.get(url, params=params)
+                    if response.status_code != 429 and response.status_code < 500:
+                        break
+                    error = RuntimeError(f"World Bank API returned status code {response.status_code}")
+                except httpx.TransportError as e:
+                    error = e
+                if attempt == self.max_retries:
+                    self._record_result(False)
+                    raise error
+                await asyncio.sleep(self._retry_delay(response, attempt))
+
+        self._record_result(True)
+        return response.json()
+
+    async def get_countries(self):
         """Get list of countries from World Bank API"""
         try:
-            url = f"{self.base_url}/country?format=json&per_page=1000"
-            response = requests.get(url)
-            return response.json()
+            url = f"{self.base_url}/country"
+            return await self._get_json(url, {"format": "json", "per_page": 1000})
         except Exception as e:
             return {"error": str(e)}
 
-    def get_indicators(self):
+    async def get_indicators(self):
         """Get list of indicators from World Bank API"""
         try:
-            url = f"{self.base_url}/indicator?format=json&per_page=50000"
-            response = requests.get(url)
-            return response.json()
+            url = f"{self.base_url}/indicator"
+            return await self._get_json(url, {"format": "json", "per_page": 50000})
         except Exception as e:
             return {"error": str(e)}
 
-    def get_indicator_for_country(self, country_id, indicator_id):
+    async def get_indicator_for_country(self, country_id, indicator_id):
         """Get values for an indicator for a specific country"""
         try:
-            url = f"{self.base_url}/country/{country_id}/indicator/{indicator_id}?format=json&per_page=20000"
-            response = requests.get(url)
-            data = response.json()
+            url = _indicator_url(self.base_url, country_id, indicator_id)
+            data = await self._get_json(url, {"format": "json", "per_page": 20000})
 
             # Handle case where API returns error
             if not isinstance(data, list) or len(data) < 2:
@@ -60,10 +132,10 @@ class WorldBankService:
 # Resource function definitions
 
 
-def get_worldbank_countries():
+async def get_worldbank_countries():
     """Get list of countries from World Bank API"""
     wb_service = _get_worldbank_service()
-    countries = wb_service.get_countries()
+    countries = await wb_service.get_countries()
 
     if "error" in countries:
         return f"Error fetching countries: {countries['error']}"
@@ -77,10 +149,10 @@ def get_worldbank_countries():
         return f"Error processing country data: {str(e)}"
 
 
-def get_worldbank_indicators():
+async def get_worldbank_indicators():
     """Get list of indicators from World Bank API"""
     wb_service = _get_worldbank_service()
-    indicators = wb_service.get_indicators()
+    indicators = await wb_service.get_indicators()
 
     if "error" in indicators:
         return f"Error fetching indicators: {indicators['error']}"
@@ -107,10 +179,10 @@ async def worldbank_get_indicator(country_id: str, indicator_id: str, ctx: Conte
     try:
         import httpx
 
-        url = f"https://api.worldbank.org/v2/country/{country_id}/indicator/{indicator_id}?format=json&per_page=20000"
+        url = _indicator_url("https://api.worldbank.org/v2", country_id, indicator_id)
 
         async with httpx.AsyncClient() as client:
-            response = await client.get(url)
+            response = await client.get(url, params={"format": "json", "per_page": 20000})
 
             # Handle non-200 responses
             if response.status_code != 200:
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 import os
 import json
+import asyncio
 import logging
+import functools
+import types
 import pandas as pd
 import numpy as np
 from enum import Enum
@@ -11,6 +14,8 @@ from datetime import datetime, timedelta
 # Ensure compatibility with mcp server
 from mcp.server.fastmcp import FastMCP, Context
 
+from app.tools.json_utils import to_json
+
 # External MCP reference for tool registration
 external_mcp = None
 
@@ -40,6 +45,18 @@ class YFinanceTools(str, Enum):
     DOWNLOAD_DATA = "yfinance_download_data"
 
 
+def _in_thread(method):
+    """Run a blocking YFinanceService method in a worker thread
+
+    yfinance fetches over plain requests, so calling it directly would stall
+    the event loop, and every other tool, for the whole download.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return await asyncio.to_thread(method, self, *args, **kwargs)
+    return wrapper
+
+
 class YFinanceService:
     """Service to handle YFinance operations"""
 
@@ -93,7 +110,8 @@ class YFinanceService:
 
         return data
 
-    async def get_ticker_info(self, ticker_symbol):
+    @_in_thread
+    def get_ticker_info(self, ticker_symbol):
         """Get basic information about a ticker"""
         try:
             self._is_initialized()
@@ -111,7 +129,8 @@ class YFinanceService:
         except Exception as e:
             return {"error": f"Error retrieving ticker info: {str(e)}"}
 
-    async def get_historical_data(self, ticker_symbol, period="1mo", interval="1d", start=None, end=None):
+    @_in_thread
+    def get_historical_data(self, ticker_symbol, period="1mo", interval="1d", start=None, end=None):
         """Get historical market data for a ticker"""
         try:
             self._is_initialized()
@@ -137,7 +156,8 @@ class YFinanceService:
         except Exception as e:
             return {"error": f"Error retrieving historical data: {str(e)}"}
 
-    async def get_financials(self, ticker_symbol, quarterly=False):
+    @_in_thread
+    def get_financials(self, ticker_symbol, quarterly=False):
         """Get income statement data for a ticker"""
         try:
             self._is_initialized()
@@ -160,7 +180,8 @@ class YFinanceService:
         except Exception as e:
             return {"error": f"Error retrieving financials: {str(e)}"}
 
-    async def get_balance_sheet(self, ticker_symbol, quarterly=False):
+    @_in_thread
+    def get_balance_sheet(self, ticker_symbol, quarterly=False):
         """Get balance sheet data for a ticker"""
         try:
             self._is_initialized()
@@ -183,7 +204,8 @@ class YFinanceService:
         except Exception as e:
             return {"error": f"Error retrieving balance sheet: {str(e)}"}
 
-    async def get_cashflow(self, ticker_symbol, quarterly=False):
+    @_in_thread
+    def get_cashflow(self, ticker_symbol, quarterly=False):
         """Get cash flow data for a ticker"""
         try:
             self._is_initialized()
@@ -206,7 +228,8 @@ class YFinanceService:
         except Exception as e:
             return {"error": f"Error retrieving cashflow: {str(e)}"}
 
-    async def get_earnings(self, ticker_symbol, quarterly=False):
+    @_in_thread
+    def get_earnings(self, ticker_symbol, quarterly=False):
         """Get earnings data for a ticker"""
         try:
             self._is_initialized()
@@ -229,7 +252,8 @@ class YFinanceService:
         except Exception as e:
             return {"error": f"Error retrieving earnings: {str(e)}"}
 
-    async def get_major_holders(self, ticker_symbol):
+    @_in_thread
+    def get_major_holders(self, ticker_symbol):
         """Get major shareholders for a ticker"""
         try:
             self._is_initialized()
@@ -247,7 +271,8 @@ class YFinanceService:
         except Exception as e:
             return {"error": f"Error retrieving major holders: {str(e)}"}
 
-    async def get_institutional_holders(self, ticker_symbol):
+    @_in_thread
+    def get_institutional_holders(self, ticker_symbol):
         """Get institutional shareholders for a ticker"""
         try:
             self._is_initialized()
@@ -265,7 +290,8 @@ class YFinanceService:
         except Exception as e:
             return {"error": f"Error retrieving institutional holders: {str(e)}"}
 
-    async def get_recommendations(self, ticker_symbol):
+    @_in_thread
+    def get_recommendations(self, ticker_symbol):
         """Get analyst recommendations for a ticker"""
         try:
             self._is_initialized()
@@ -283,7 +309,8 @@ class YFinanceService:
         except Exception as e:
             return {"error": f"Error retrieving recommendations: {str(e)}"}
 
-    async def get_calendar(self, ticker_symbol):
+    @_in_thread
+    def get_calendar(self, ticker_symbol):
         """Get earnings calendar for a ticker"""
         try:
             self._is_initialized()
@@ -301,7 +328,8 @@ class YFinanceService:
         except Exception as e:
             return {"error": f"Error retrieving calendar: {str(e)}"}
 
-    async def get_options(self, ticker_symbol, date=None):
+    @_in_thread
+    def get_options(self, ticker_symbol, date=None):
         """Get options chain data for a ticker"""
         try:
             self._is_initialized()
@@ -339,7 +367,8 @@ class YFinanceService:
         except Exception as e:
             return {"error": f"Error retrieving options data: {str(e)}"}
 
-    async def get_news(self, ticker_symbol):
+    @_in_thread
+    def get_news(self, ticker_symbol):
         """Get recent news about a ticker"""
         try:
             self._is_initialized()
@@ -365,7 +394,8 @@ class YFinanceService:
         except Exception as e:
             return {"error": f"Error retrieving news: {str(e)}"}
 
-    async def search_ticker(self, query):
+    @_in_thread
+    def search_ticker(self, query):
         """Search for ticker symbols matching a query"""
         try:
             self._is_initialized()
@@ -393,7 +423,8 @@ class YFinanceService:
         except Exception as e:
             return {"error": f"Error searching ticker: {str(e)}"}
 
-    async def download_data(self, tickers, period="1mo", interval="1d", start=None, end=None, group_by="ticker", threads=True):
+    @_in_thread
+    def download_data(self, tickers, period="1mo", interval="1d", start=None, end=None, group_by="ticker", threads=True):
         """Download historical market data for multiple tickers"""
         try:
             self._is_initialized()
@@ -434,8 +465,30 @@ class YFinanceService:
             return {"error": f"Error downloading data: {str(e)}"}
 
 
+# MCP clients parse tool output rather than read it, so responses are compact
+# unless YFINANCE_PRETTY_JSON is set for debugging
+_PRETTY_JSON = os.environ.get("YFINANCE_PRETTY_JSON", "").lower() in ("1", "true", "yes")
+
+_to_json = functools.partial(to_json, indent=_PRETTY_JSON)
+
+
+def _yfinance_tool(error_message):
+    """Check initialization, serialize the result and report exceptions for a yfinance tool"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not _get_yfinance_service():
+                return "YFinance service not properly initialized. Check if yfinance library is installed."
+            try:
+                return _to_json(await func(*args, **kwargs))
+            except Exception as e:
+                return f"{error_message}: {str(e)}"
+        return wrapper
+    return decorator
+
 # Tool function definitions that will be registered with MCP
 
+@_yfinance_tool("Error retrieving ticker info")
 async def yfinance_get_ticker_info(ticker_symbol: str, ctx: Context = None) -> str:
     """Get basic information about a ticker symbol
 
@@ -445,17 +498,10 @@ async def yfinance_get_ticker_info(ticker_symbol: str, ctx: Context = None) -> s
     Returns:
     - JSON string containing the ticker's basic information
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.get_ticker_info(ticker_symbol)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving ticker info: {str(e)}"
+    return await _get_yfinance_service().get_ticker_info(ticker_symbol)
 
 
+@_yfinance_tool("Error retrieving historical data")
 async def yfinance_get_historical_data(
     ticker_symbol: str,
     period: str = "1mo",
@@ -476,17 +522,10 @@ async def yfinance_get_historical_data(
     Returns:
     - JSON string containing historical price data
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.get_historical_data(ticker_symbol, period, interval, start, end)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving historical data: {str(e)}"
+    return await _get_yfinance_service().get_historical_data(ticker_symbol, period, interval, start, end)
 
 
+@_yfinance_tool("Error retrieving financials")
 async def yfinance_get_financials(
     ticker_symbol: str,
     quarterly: bool = False,
@@ -501,17 +540,10 @@ async def yfinance_get_financials(
     Returns:
     - JSON string containing financial data
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.get_financials(ticker_symbol, quarterly)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving financials: {str(e)}"
+    return await _get_yfinance_service().get_financials(ticker_symbol, quarterly)
 
 
+@_yfinance_tool("Error retrieving balance sheet")
 async def yfinance_get_balance_sheet(
     ticker_symbol: str,
     quarterly: bool = False,
@@ -526,17 +558,10 @@ async def yfinance_get_balance_sheet(
     Returns:
     - JSON string containing balance sheet data
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.get_balance_sheet(ticker_symbol, quarterly)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving balance sheet: {str(e)}"
+    return await _get_yfinance_service().get_balance_sheet(ticker_symbol, quarterly)
 
 
+@_yfinance_tool("Error retrieving cashflow")
 async def yfinance_get_cashflow(
     ticker_symbol: str,
     quarterly: bool = False,
@@ -551,17 +576,10 @@ async def yfinance_get_cashflow(
     Returns:
     - JSON string containing cash flow data
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.get_cashflow(ticker_symbol, quarterly)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving cashflow: {str(e)}"
+    return await _get_yfinance_service().get_cashflow(ticker_symbol, quarterly)
 
 
+@_yfinance_tool("Error retrieving earnings")
 async def yfinance_get_earnings(
     ticker_symbol: str,
     quarterly: bool = False,
@@ -576,17 +594,10 @@ async def yfinance_get_earnings(
     Returns:
     - JSON string containing earnings data
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.get_earnings(ticker_symbol, quarterly)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving earnings: {str(e)}"
+    return await _get_yfinance_service().get_earnings(ticker_symbol, quarterly)
 
 
+@_yfinance_tool("Error retrieving major holders")
 async def yfinance_get_major_holders(
     ticker_symbol: str,
     ctx: Context = None
@@ -599,17 +610,10 @@ async def yfinance_get_major_holders(
     Returns:
     - JSON string containing major shareholders data
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.get_major_holders(ticker_symbol)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving major holders: {str(e)}"
+    return await _get_yfinance_service().get_major_holders(ticker_symbol)
 
 
+@_yfinance_tool("Error retrieving institutional holders")
 async def yfinance_get_institutional_holders(
     ticker_symbol: str,
     ctx: Context = None
@@ -622,17 +626,10 @@ async def yfinance_get_institutional_holders(
     Returns:
     - JSON string containing institutional shareholders data
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.get_institutional_holders(ticker_symbol)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving institutional holders: {str(e)}"
+    return await _get_yfinance_service().get_institutional_holders(ticker_symbol)
 
 
+@_yfinance_tool("Error retrieving recommendations")
 async def yfinance_get_recommendations(
     ticker_symbol: str,
     ctx: Context = None
@@ -645,17 +642,10 @@ async def yfinance_get_recommendations(
     Returns:
     - JSON string containing analyst recommendations
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.get_recommendations(ticker_symbol)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving recommendations: {str(e)}"
+    return await _get_yfinance_service().get_recommendations(ticker_symbol)
 
 
+@_yfinance_tool("Error retrieving calendar")
 async def yfinance_get_calendar(
     ticker_symbol: str,
     ctx: Context = None
@@ -668,17 +658,10 @@ async def yfinance_get_calendar(
     Returns:
     - JSON string containing earnings calendar data
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.get_calendar(ticker_symbol)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving calendar: {str(e)}"
+    return await _get_yfinance_service().get_calendar(ticker_symbol)
 
 
+@_yfinance_tool("Error retrieving options data")
 async def yfinance_get_options(
     ticker_symbol: str,
     date: str = None,
@@ -693,17 +676,10 @@ async def yfinance_get_options(
     Returns:
     - JSON string containing options chain data
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.get_options(ticker_symbol, date)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving options data: {str(e)}"
+    return await _get_yfinance_service().get_options(ticker_symbol, date)
 
 
+@_yfinance_tool("Error retrieving news")
 async def yfinance_get_news(
     ticker_symbol: str,
     ctx: Context = None
@@ -716,17 +692,10 @@ async def yfinance_get_news(
     Returns:
     - JSON string containing news articles
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.get_news(ticker_symbol)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error retrieving news: {str(e)}"
+    return await _get_yfinance_service().get_news(ticker_symbol)
 
 
+@_yfinance_tool("Error searching ticker")
 async def yfinance_search_ticker(
     query: str,
     ctx: Context = None
@@ -739,17 +708,10 @@ async def yfinance_search_ticker(
     Returns:
     - JSON string containing search results
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.search_ticker(query)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error searching ticker: {str(e)}"
+    return await _get_yfinance_service().search_ticker(query)
 
 
+@_yfinance_tool("Error downloading data")
 async def yfinance_download_data(
     tickers: Union[str, List[str]],
     period: str = "1mo",
@@ -774,15 +736,7 @@ async def yfinance_download_data(
     Returns:
     - JSON string containing downloaded data
     """
-    yfinance = _get_yfinance_service()
-    if not yfinance:
-        return "YFinance service not properly initialized. Check if yfinance library is installed."
-
-    try:
-        result = await yfinance.download_data(tickers, period, interval, start, end, group_by, threads)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error downloading data: {str(e)}"
+    return await _get_yfinance_service().download_data(tickers, period, interval, start, end, group_by, threads)
 
 # Tool registration and initialization
 _yfinance_service = None
@@ -803,24 +757,28 @@ def _get_yfinance_service():
     return _yfinance_service
 
 
+# Built once at import; read-only so registrars cannot mutate the shared map
+_YFINANCE_TOOLS = types.MappingProxyType({
+    YFinanceTools.GET_TICKER_INFO: yfinance_get_ticker_info,
+    YFinanceTools.GET_HISTORICAL_DATA: yfinance_get_historical_data,
+    YFinanceTools.GET_FINANCIALS: yfinance_get_financials,
+    YFinanceTools.GET_BALANCE_SHEET: yfinance_get_balance_sheet,
+    YFinanceTools.GET_CASHFLOW: yfinance_get_cashflow,
+    YFinanceTools.GET_EARNINGS: yfinance_get_earnings,
+    YFinanceTools.GET_MAJOR_HOLDERS: yfinance_get_major_holders,
+    YFinanceTools.GET_INSTITUTIONAL_HOLDERS: yfinance_get_institutional_holders,
+    YFinanceTools.GET_RECOMMENDATIONS: yfinance_get_recommendations,
+    YFinanceTools.GET_CALENDAR: yfinance_get_calendar,
+    YFinanceTools.GET_OPTIONS: yfinance_get_options,
+    YFinanceTools.GET_NEWS: yfinance_get_news,
+    YFinanceTools.SEARCH_TICKER: yfinance_search_ticker,
+    YFinanceTools.DOWNLOAD_DATA: yfinance_download_data
+})
+
+
 def get_yfinance_tools():
-    """Get a dictionary of all YFinance tools for registration with MCP"""
-    return {
-        YFinanceTools.GET_TICKER_INFO: yfinance_get_ticker_info,
-        YFinanceTools.GET_HISTORICAL_DATA: yfinance_get_historical_data,
-        YFinanceTools.GET_FINANCIALS: yfinance_get_financials,
-        YFinanceTools.GET_BALANCE_SHEET: yfinance_get_balance_sheet,
-        YFinanceTools.GET_CASHFLOW: yfinance_get_cashflow,
-        YFinanceTools.GET_EARNINGS: yfinance_get_earnings,
-        YFinanceTools.GET_MAJOR_HOLDERS: yfinance_get_major_holders,
-        YFinanceTools.GET_INSTITUTIONAL_HOLDERS: yfinance_get_institutional_holders,
-        YFinanceTools.GET_RECOMMENDATIONS: yfinance_get_recommendations,
-        YFinanceTools.GET_CALENDAR: yfinance_get_calendar,
-        YFinanceTools.GET_OPTIONS: yfinance_get_options,
-        YFinanceTools.GET_NEWS: yfinance_get_news,
-        YFinanceTools.SEARCH_TICKER: yfinance_search_ticker,
-        YFinanceTools.DOWNLOAD_DATA: yfinance_download_data
-    }
+    """Get a read-only mapping of all YFinance tools for registration with MCP"""
+    return _YFINANCE_TOOLS
 
 
 # This function will be called by the unified server to initialize the module
@@ -0,0 +1,456 @@
+"""
+Tests for the Excel/DataFrame service fast paths, checked against plain pandas
+"""
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import importlib.util
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from app.tools import excel
+from app.tools.excel import XlsxWriterService
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+HAS_OPENPYXL = importlib.util.find_spec("openpyxl") is not None
+
+
+class ExcelServiceTestCase(unittest.IsolatedAsyncioTestCase):
+    """Base class with a fresh service and a scratch directory."""
+
+    def setUp(self):
+        self.service = XlsxWriterService()
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def write_file(self, name, text):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+class TestReadCsvArrow(ExcelServiceTestCase):
+    """The pyarrow CSV reader must give the same frame as pandas.read_csv."""
+
+    def assert_matches_pandas(self, text, **kwargs):
+        path = self.write_file("data.csv", text)
+        df = self.service._read_csv_arrow(path, **kwargs)
+        expected = pd.read_csv(path, **kwargs)
+        if df is not None:
+            pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+        return df
+
+    def test_plain_columns(self):
+        df = self.assert_matches_pandas("a,b,c\n1,x,1.5\n2,,2.5\n3,z,\n")
+        self.assertIsNotNone(df)
+
+    def test_pandas_na_markers(self):
+        df = self.assert_matches_pandas("a,b\nNone,1\nx,2\nNA,3\nn/a,4\n")
+        self.assertIsNotNone(df)
+        self.assertEqual(df["a"].isna().tolist(), [True, False, True, True])
+
+    def test_dates_stay_text(self):
+        df = self.assert_matches_pandas("a,b\n2024-01-05,1\n2024-02-06,2\n")
+        self.assertEqual(df["a"].tolist(), ["2024-01-05", "2024-02-06"])
+
+    def test_times_stay_text(self):
+        df = self.assert_matches_pandas("a,b\n12:30,1\n01:02:03,2\n")
+        self.assertEqual(df["a"].tolist(), ["12:30", "01:02:03"])
+
+    def test_no_header(self):
+        df = self.assert_matches_pandas("1,2\n3,4\n", header=None)
+        self.assertEqual(list(df.columns), [0, 1])
+
+    def test_duplicate_headers_fall_back(self):
+        self.assertIsNone(self.assert_matches_pandas("a,a,b\n1,2,3\n4,5,6\n"))
+
+    def test_uint64_falls_back(self):
+        self.assertIsNone(
+            self.assert_matches_pandas("a,b\n18446744073709551615,1\n1,2\n"))
+
+    async def test_read_csv_matches_pandas(self):
+        path = self.write_file("data.csv", "a,a,b\n1,2,3\n4,5,6\n")
+        df = await self.service.read_csv(path)
+        pd.testing.assert_frame_equal(df, pd.read_csv(path))
+
+
+def _sample_frame(n=200, seed=1):
+    """Mixed-dtype frame with missing values for comparing against pandas"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "g": rng.choice(["x", "y", "z"], n),
+        "h": rng.choice([1, 2], n),
+        "f": rng.normal(size=n),
+        "i": rng.integers(0, 9, n),
+        "i8": rng.integers(-5, 5, n).astype("int8"),
+        "u8": rng.integers(0, 5, n).astype("uint8"),
+        "f32": rng.normal(size=n).astype("float32"),
+        "b": rng.random(n) > 0.5,
+    })
+    # One group is entirely missing so sums must come out as 0
+    df.loc[df["g"] == "z", "f"] = np.nan
+    df.loc[::7, "i"] = -1
+    return df
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+class TestSortDataframe(ExcelServiceTestCase):
+    """Arrow's sort must order rows exactly like sort_values."""
+
+    async def assert_matches_pandas(self, df, by, ascending=True):
+        result = await self.service.sort_dataframe(df, by, ascending)
+        expected = df.sort_values(by=by, ascending=ascending, kind="stable")
+        pd.testing.assert_frame_equal(result, expected)
+
+    async def test_single_key(self):
+        await self.assert_matches_pandas(_sample_frame(), "i")
+
+    async def test_mixed_directions(self):
+        await self.assert_matches_pandas(_sample_frame(), ["g", "i"], [True, False])
+
+    async def test_missing_values_last(self):
+        df = pd.DataFrame({"a": [3.0, np.nan, 1.0, np.nan, 2.0]})
+        await self.assert_matches_pandas(df, "a")
+        await self.assert_matches_pandas(df, "a", False)
+
+    async def test_keeps_index(self):
+        df = _sample_frame().set_index(pd.Index(range(1000, 1200)))
+        await self.assert_matches_pandas(df, "f")
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+class TestGroupDataframe(ExcelServiceTestCase):
+    """Arrow's group_by must aggregate like DataFrame.groupby."""
+
+    FUNCS = ["sum", "mean", "min", "max", "count", "nunique", "std", "var"]
+
+    async def assert_matches_pandas(self, df, by, agg_func):
+        result = await self.service.group_dataframe(df, by, agg_func)
+        expected = df.groupby(by).agg(agg_func).reset_index()
+        pd.testing.assert_frame_equal(result, expected, check_exact=False)
+
+    async def test_aggregations(self):
+        df = _sample_frame()
+        for func in self.FUNCS:
+            with self.subTest(func=func):
+                await self.assert_matches_pandas(df, ["g"], func)
+
+    async def test_aggregations_on_arrow_path(self):
+        # Only 64-bit numeric columns take the Arrow path for every function
+        df = _sample_frame()[["g", "f", "i"]]
+        for func in self.FUNCS:
+            with self.subTest(func=func):
+                self.assertIsNotNone(self.service._group_dataframe_arrow(df, ["g"], func))
+                await self.assert_matches_pandas(df, ["g"], func)
+
+    async def test_multiple_keys(self):
+        df = _sample_frame()
+        for func in self.FUNCS:
+            with self.subTest(func=func):
+                await self.assert_matches_pandas(df, ["g", "h"], func)
+
+    async def test_all_missing_group_sums_to_zero(self):
+        result = await self.service.group_dataframe(_sample_frame()[["g", "f"]], "g", "sum")
+        self.assertEqual(result.loc[result["g"] == "z", "f"].item(), 0)
+
+    async def test_bool_sum_is_not_unsigned(self):
+        result = await self.service.group_dataframe(_sample_frame()[["g", "b"]], "g", "sum")
+        self.assertEqual(result["b"].dtype, np.int64)
+
+    async def test_string_values(self):
+        df = _sample_frame()[["g", "i"]].assign(s=lambda d: d["g"].where(d["i"] > 2))
+        for func in ["min", "max", "count", "nunique"]:
+            with self.subTest(func=func):
+                await self.assert_matches_pandas(df, ["i"], func)
+
+    async def test_default_is_count(self):
+        df = _sample_frame()
+        result = await self.service.group_dataframe(df, "g")
+        pd.testing.assert_frame_equal(result, df.groupby("g").count().reset_index())
+
+
+class TestFilterQuery(ExcelServiceTestCase):
+    """Query filters must select the same rows as the python engine."""
+
+    async def assert_matches_pandas(self, df, query):
+        result = await self.service.filter_dataframe(df, query=query)
+        pd.testing.assert_frame_equal(result, df.query(query, engine="python"))
+
+    async def test_numeric_queries(self):
+        df = _sample_frame()
+        for query in ["i > 3", "f < 0 and i != -1", "(i8 >= 0) | (u8 == 2)", "f32 * 2 > f"]:
+            with self.subTest(query=query):
+                await self.assert_matches_pandas(df, query)
+
+    async def test_string_queries(self):
+        df = _sample_frame()
+        for query in ["g == 'x'", "g in ['x', 'z'] and i > 2", "g.str.startswith('y')"]:
+            with self.subTest(query=query):
+                await self.assert_matches_pandas(df, query)
+
+    async def test_invalid_query(self):
+        result = await self.service.filter_dataframe(_sample_frame(), query="nosuch > 1")
+        self.assertIn("error", result)
+
+
+class TestFilterColumn(ExcelServiceTestCase):
+    """Column/value filters must select the same rows as pandas comparisons."""
+
+    OPERATORS = {
+        "==": lambda s, v: s == v,
+        "!=": lambda s, v: s != v,
+        ">": lambda s, v: s > v,
+        ">=": lambda s, v: s >= v,
+        "<": lambda s, v: s < v,
+        "<=": lambda s, v: s <= v,
+    }
+
+    async def assert_matches_pandas(self, df, column, value):
+        for operator, compare in self.OPERATORS.items():
+            with self.subTest(column=column, value=value, operator=operator):
+                result = await self.service.filter_dataframe(
+                    df, column=column, value=value, operator=operator)
+                pd.testing.assert_frame_equal(result, df[compare(df[column], value)])
+
+    async def test_numeric_columns(self):
+        df = _sample_frame()
+        await self.assert_matches_pandas(df, "i", 3)
+        await self.assert_matches_pandas(df, "i", 2.5)
+        await self.assert_matches_pandas(df, "f", 0.1)
+        await self.assert_matches_pandas(df, "i8", -2)
+        await self.assert_matches_pandas(df, "u8", 1)
+
+    async def test_missing_values_never_match(self):
+        df = pd.DataFrame({"a": [1.0, np.nan, 3.0]})
+        await self.assert_matches_pandas(df, "a", 1)
+
+    async def test_nullable_integers(self):
+        df = pd.DataFrame({"a": pd.array([1, None, 3, 4], dtype="Int64")})
+        await self.assert_matches_pandas(df, "a", 3)
+
+    async def test_string_column(self):
+        await self.assert_matches_pandas(_sample_frame(), "g", "y")
+
+    async def test_in_and_contains(self):
+        df = _sample_frame()
+        result = await self.service.filter_dataframe(df, column="g", value=["x", "z"], operator="in")
+        pd.testing.assert_frame_equal(result, df[df["g"].isin(["x", "z"])])
+        result = await self.service.filter_dataframe(df, column="g", value="y", operator="contains")
+        pd.testing.assert_frame_equal(result, df[df["g"] == "y"])
+
+    async def test_unknown_column(self):
+        result = await self.service.filter_dataframe(_sample_frame(), column="nosuch", value=1)
+        self.assertIn("error", result)
+
+
+class TestDowncast(ExcelServiceTestCase):
+    """Downcasting must be opt-in and keep every value exactly."""
+
+    def tearDown(self):
+        excel._clear_dataframe("downcast_test")
+        super().tearDown()
+
+    def test_values_preserved(self):
+        df = pd.DataFrame({
+            "small": [1, 2, 3],
+            "wide": [1, 2, 2 ** 40],
+            "half": [0.5, 1.5, np.nan],
+            "precise": [0.1, 0.2, 0.3],
+            "flag": [True, False, True],
+            "text": ["a", "b", "c"],
+        })
+        original = df.copy()
+        result, dtype_map = self.service._downcast_numeric(df.copy())
+        self.assertEqual(result["small"].dtype, np.int8)
+        self.assertEqual(result["wide"].dtype, np.int64)
+        self.assertEqual(result["half"].dtype, np.float32)
+        # float32 would round these, so they stay float64
+        self.assertEqual(result["precise"].dtype, np.float64)
+        self.assertEqual(result["flag"].dtype, bool)
+        self.assertEqual(set(dtype_map), {"small", "half"})
+        pd.testing.assert_frame_equal(result, original, check_dtype=False)
+
+    async def test_read_csv_is_opt_in(self):
+        path = self.write_file("data.csv", "a,b\n1,0.5\n2,1.5\n")
+        response = json.loads(await excel.xlsx_read_csv(path, "downcast_test"))
+        self.assertEqual(response["dtype_map"], {})
+        self.assertEqual(excel._get_dataframe("downcast_test")["a"].dtype, np.int64)
+
+        response = json.loads(await excel.xlsx_read_csv(path, "downcast_test", downcast=True))
+        self.assertEqual(response["dtype_map"]["a"], {"original": "int64", "stored": "int8"})
+        pd.testing.assert_frame_equal(excel._get_dataframe("downcast_test"),
+                                      pd.read_csv(path), check_dtype=False)
+
+
+class TestCategorize(ExcelServiceTestCase):
+    """Categorical storage must be opt-in and give the same results as plain strings."""
+
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(0)
+        n = excel.CATEGORY_MIN_ROWS * 2
+        self.df = pd.DataFrame({
+            "k": rng.choice(list("abcd"), n),
+            "u": [f"id{i}" for i in range(n)],
+            "v": rng.integers(0, 100, n),
+        })
+        self.encoded = excel._categorize_dataframe(self.df)
+
+    def tearDown(self):
+        excel._clear_dataframe("categorize_test")
+        super().tearDown()
+
+    def test_encodes_repetitive_columns_only(self):
+        self.assertIsInstance(self.encoded["k"].dtype, pd.CategoricalDtype)
+        self.assertNotIsInstance(self.encoded["u"].dtype, pd.CategoricalDtype)
+        self.assertNotIsInstance(self.df["k"].dtype, pd.CategoricalDtype)
+
+    def test_small_frames_untouched(self):
+        small = self.df.head(10)
+        self.assertIs(excel._categorize_dataframe(small), small)
+
+    async def test_read_csv_is_opt_in(self):
+        path = os.path.join(self.tmpdir, "data.csv")
+        self.df.to_csv(path, index=False)
+        await excel.xlsx_read_csv(path, "categorize_test")
+        stored = excel._get_dataframe("categorize_test")
+        self.assertNotIsInstance(stored["k"].dtype, pd.CategoricalDtype)
+
+        await excel.xlsx_read_csv(path, "categorize_test", categorize=True)
+        stored = excel._get_dataframe("categorize_test")
+        self.assertIsInstance(stored["k"].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(stored, pd.read_csv(path), check_dtype=False,
+                                      check_categorical=False)
+
+    async def test_column_filters_match_plain_strings(self):
+        for operator in ["==", "!=", ">", ">=", "<", "<="]:
+            with self.subTest(operator=operator):
+                result = await self.service.filter_dataframe(
+                    self.encoded, column="k", value="b", operator=operator)
+                expected = await self.service.filter_dataframe(
+                    self.df, column="k", value="b", operator=operator)
+                self.assertEqual(result.index.tolist(), expected.index.tolist())
+
+    async def test_query_filters_match_plain_strings(self):
+        for query in ["k > 'b'", "k == 'c' and v < 50", "k in ['a', 'd']"]:
+            with self.subTest(query=query):
+                result = await self.service.filter_dataframe(self.encoded, query=query)
+                self.assertEqual(result.index.tolist(),
+                                 self.df.query(query).index.tolist())
+
+    async def test_groups_skip_unobserved_categories(self):
+        subset = self.encoded[self.encoded["k"] != "a"]
+        result = await self.service.group_dataframe(subset, "k", {"v": "sum"})
+        expected = self.df[self.df["k"] != "a"].groupby("k").agg({"v": "sum"}).reset_index()
+        self.assertEqual(result["k"].astype(str).tolist(), expected["k"].tolist())
+        self.assertEqual(result["v"].tolist(), expected["v"].tolist())
+
+
+@unittest.skipUnless(HAS_OPENPYXL, "openpyxl not installed")
+class TestStreamDataframeToExcel(ExcelServiceTestCase):
+    """The streaming writer must produce the same sheet as df.to_excel."""
+
+    def read_sheet(self, path):
+        import openpyxl
+        sheet = openpyxl.load_workbook(path).active
+        values = [[cell.value for cell in row] for row in sheet.iter_rows()]
+        header_styles = [(cell.font.b, cell.border.left.style, cell.alignment.horizontal)
+                         for cell in sheet[1]]
+        index_bold = [cell.font.b for cell in sheet["A"]]
+        return values, header_styles, index_bold
+
+    async def assert_matches_pandas(self, df, index=True):
+        path = os.path.join(self.tmpdir, "streamed.xlsx")
+        expected_path = os.path.join(self.tmpdir, "expected.xlsx")
+        self.assertTrue(self.service._can_stream_dataframe(df))
+        result = await self.service.dataframe_to_excel(df, path, index=index)
+        self.assertEqual(result["status"], "exported")
+        df.to_excel(expected_path, index=index)
+        self.assertEqual(self.read_sheet(path), self.read_sheet(expected_path))
+
+    async def test_mixed_values(self):
+        df = pd.DataFrame({
+            "a": [1.0, np.inf, -np.inf, np.nan],
+            "b": ["x", None, "z", "w"],
+            "c": [1, 2, 3, 4],
+            "d": [True, False, True, False],
+        })
+        for index in (True, False):
+            with self.subTest(index=index):
+                await self.assert_matches_pandas(df, index)
+
+    async def test_named_index(self):
+        df = _sample_frame(20)[["g", "f", "i"]]
+        df.index = pd.Index(range(100, 120), name="row")
+        await self.assert_matches_pandas(df)
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+class TestChunkedReadCsv(ExcelServiceTestCase):
+    """Chunked reads must keep only a few chunks in memory."""
+
+    def tearDown(self):
+        for dataframe_id in excel._list_dataframes():
+            if dataframe_id.startswith("chunked_"):
+                excel._clear_dataframe(dataframe_id)
+        super().tearDown()
+
+    def write_csv(self, rows):
+        path = os.path.join(self.tmpdir, "data.csv")
+        df = pd.DataFrame({"a": range(rows), "b": [f"s{i % 7}" for i in range(rows)]})
+        df.to_csv(path, index=False)
+        return path, df
+
+    async def test_chunks_spilled_and_evicted(self):
+        path, df = self.write_csv(2_000)
+        response = json.loads(await excel.xlsx_read_csv(path, "chunked", chunksize=100))
+        self.assertEqual(response["num_chunks"], 20)
+
+        live = [i for i in response["chunk_ids"] if i in excel._dataframes]
+        self.assertLessEqual(len(live), excel.HOT_DATAFRAMES)
+        for chunk_id in response["chunk_ids"]:
+            self.assertIsNotNone(excel._get_dataframe_metadata(chunk_id)["path"])
+
+        chunks = [excel._get_dataframe(i) for i in response["chunk_ids"]]
+        pd.testing.assert_frame_equal(pd.concat(chunks), df, check_dtype=False)
+
+    async def test_stale_chunks_removed(self):
+        path, _ = self.write_csv(500)
+        await excel.xlsx_read_csv(path, "chunked", chunksize=100)
+        response = json.loads(await excel.xlsx_read_csv(path, "chunked", chunksize=250))
+        stored = sorted(i for i in excel._list_dataframes() if i.startswith("chunked_"))
+        self.assertEqual(stored, sorted(response["chunk_ids"]))
+
+
+class TestConsolidateDataframe(unittest.TestCase):
+    """Consolidating a fragmented frame must keep its values."""
+
+    def fragmented_frame(self):
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        for i in range(5):
+            df[f"c{i}"] = [i, i + 1, i + 2]
+        df["s"] = ["x", "y", "z"]
+        return df
+
+    def test_same_values(self):
+        df = self.fragmented_frame()
+        self.assertFalse(df._mgr.is_consolidated())
+        result = excel._consolidate_dataframe(df)
+        pd.testing.assert_frame_equal(result, df)
+
+    def test_missing_block_manager_api(self):
+        df = self.fragmented_frame()
+        with patch.object(type(df._mgr), "is_consolidated", create=True, new=property()):
+            self.assertIs(excel._consolidate_dataframe(df), df)
+
+
+if __name__ == "__main__":
+    unittest.main()
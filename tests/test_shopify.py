@@ -0,0 +1,119 @@
+"""
+Tests for the Shopify service's HTTP client reuse and retry handling
+"""
+import asyncio
+import threading
+import unittest
+
+import httpx
+
+from app.tools.shopify import ShopifyService
+
+
+class TestShopifyRetries(unittest.IsolatedAsyncioTestCase):
+    """Throttled and transient failures are retried, everything else is not."""
+
+    def setUp(self):
+        self.service = ShopifyService("test.myshopify.com", "2023-10", access_token="token")
+        self.service.min_request_interval = 0
+        self.service.retry_backoff = 0
+        self.requests = []
+
+    def use_responses(self, *responses):
+        """Answer requests with the given responses in order, repeating the last"""
+        def handler(request):
+            self.requests.append(request)
+            return responses[min(len(self.requests), len(responses)) - 1]
+
+        self.service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.service._client_loop = asyncio.get_running_loop()
+
+    async def asyncTearDown(self):
+        await self.service.close()
+
+    def test_retry_after_honoured(self):
+        response = httpx.Response(429, headers={"Retry-After": "2.0"})
+        self.assertEqual(self.service._retry_delay(response, 0), 2.0)
+
+    def test_retry_after_clamped(self):
+        self.service.retry_backoff = 1.0
+        for value in ["3600", "-1", "Wed, 21 Oct 2015 07:28:00 GMT"]:
+            with self.subTest(value=value):
+                response = httpx.Response(429, headers={"Retry-After": value})
+                self.assertEqual(self.service._retry_delay(response, 2), 4.0)
+        self.assertEqual(self.service._retry_delay(httpx.Response(503), 1), 2.0)
+
+    async def test_throttled_request_retried(self):
+        self.use_responses(httpx.Response(429, headers={"Retry-After": "0"}),
+                           httpx.Response(200, json={"products": []}))
+        result = await self.service._make_request("get", "products.json")
+        self.assertEqual(result, {"products": []})
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_server_error_retried_for_get(self):
+        self.use_responses(httpx.Response(503), httpx.Response(200, json={"ok": True}))
+        self.assertEqual(await self.service._make_request("get", "shop.json"), {"ok": True})
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_server_error_not_retried_for_post(self):
+        self.use_responses(httpx.Response(503), httpx.Response(201, json={"ok": True}))
+        with self.assertRaisesRegex(Exception, "503"):
+            await self.service._make_request("post", "products.json", json_data={})
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_gives_up_after_max_retries(self):
+        self.use_responses(httpx.Response(429))
+        with self.assertRaisesRegex(Exception, "429"):
+            await self.service._make_request("get", "products.json")
+        self.assertEqual(len(self.requests), self.service.max_retries + 1)
+
+    async def test_client_errors_not_retried(self):
+        self.use_responses(httpx.Response(404, json={"errors": "Not Found"}))
+        with self.assertRaisesRegex(Exception, "404"):
+            await self.service._make_request("get", "products/1.json")
+        self.assertEqual(len(self.requests), 1)
+
+
+class TestShopifyClient(unittest.TestCase):
+    """One client is kept per event loop and the old one is closed on a switch."""
+
+    def setUp(self):
+        self.service = ShopifyService("test.myshopify.com", "2023-10", access_token="token")
+
+    async def get_client(self):
+        return self.service._get_client()
+
+    def test_client_reused_within_loop(self):
+        async def twice():
+            return self.service._get_client(), self.service._get_client()
+
+        first, second = asyncio.run(twice())
+        self.assertIs(first, second)
+
+    def test_previous_client_closed_on_loop_change(self):
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            old = asyncio.run_coroutine_threadsafe(self.get_client(), loop).result()
+            new = asyncio.run(self.get_client())
+            self.assertIsNot(old, new)
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), loop).result()
+            self.assertTrue(old.is_closed)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def test_close(self):
+        async def open_and_close():
+            client = self.service._get_client()
+            await self.service.close()
+            return client
+
+        self.assertTrue(asyncio.run(open_and_close()).is_closed)
+        self.assertIsNone(self.service._client)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Tests for the World Bank service's HTTP retries and circuit breaker
+"""
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from app.tools.worldbank import WorldBankService
+
+
+class TestWorldBankRetries(unittest.IsolatedAsyncioTestCase):
+    """Transient failures are retried and repeated failures trip the breaker."""
+
+    def setUp(self):
+        self.service = WorldBankService()
+        self.service.retry_backoff = 0
+        self.requests = []
+        self.responses = [httpx.Response(200, json=[])]
+
+    def handler(self, request):
+        self.requests.append(request)
+        response = self.responses[min(len(self.requests), len(self.responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def get_json(self):
+        transport = httpx.MockTransport(self.handler)
+
+        class MockClient(httpx.AsyncClient):
+            def __init__(self, **kwargs):
+                super().__init__(transport=transport, **kwargs)
+
+        with patch("httpx.AsyncClient", MockClient):
+            return await self.service._get_json("https://api.worldbank.org/v2/country",
+                                                {"format": "json"})
+
+    def test_retry_after_honoured(self):
+        response = httpx.Response(429, headers={"Retry-After": "3"})
+        self.assertEqual(self.service._retry_delay(response, 0), 3.0)
+
+    def test_retry_after_clamped(self):
+        self.service.retry_backoff = 1.0
+        for value in ["3600", "-1", "Wed, 21 Oct 2015 07:28:00 GMT"]:
+            with self.subTest(value=value):
+                response = httpx.Response(429, headers={"Retry-After": value})
+                delay = self.service._retry_delay(response, 2)
+                # Backoff of 4s with +/-50% jitter
+                self.assertGreaterEqual(delay, 2.0)
+                self.assertLessEqual(delay, 6.0)
+
+    async def test_server_error_retried(self):
+        self.responses = [httpx.Response(500), httpx.Response(200, json=[{"page": 1}])]
+        self.assertEqual(await self.get_json(), [{"page": 1}])
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_transport_error_retried(self):
+        self.responses = [httpx.ConnectError("refused"), httpx.Response(200, json=[])]
+        self.assertEqual(await self.get_json(), [])
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_client_error_not_retried(self):
+        self.responses = [httpx.Response(400, json={"message": "bad"})]
+        self.assertEqual(await self.get_json(), {"message": "bad"})
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_gives_up_after_max_retries(self):
+        self.responses = [httpx.Response(503)]
+        with self.assertRaisesRegex(RuntimeError, "503"):
+            await self.get_json()
+        self.assertEqual(len(self.requests), self.service.max_retries + 1)
+
+    async def test_breaker_opens_after_repeated_failures(self):
+        self.service.max_retries = 0
+        self.service.breaker_threshold = 2
+        self.responses = [httpx.Response(503)]
+        for _ in range(2):
+            with self.assertRaisesRegex(RuntimeError, "503"):
+                await self.get_json()
+
+        # Open breaker fails fast without touching the network
+        with self.assertRaisesRegex(RuntimeError, "unavailable"):
+            await self.get_json()
+        self.assertEqual(len(self.requests), 2)
+
+        # After the cooldown a success closes it again
+        self.service._breaker_open_until = 0.0
+        self.responses = [httpx.Response(200, json=[])]
+        self.requests = []
+        self.assertEqual(await self.get_json(), [])
+        self.assertEqual(self.service._consecutive_failures, 0)
+
+    async def test_success_resets_failure_count(self):
+        self.service.max_retries = 0
+        self.service.breaker_threshold = 2
+        self.responses = [httpx.Response(503), httpx.Response(200, json=[])]
+        with self.assertRaises(RuntimeError):
+            await self.get_json()
+        await self.get_json()
+        self.responses = [httpx.Response(503)]
+        self.requests = []
+        with self.assertRaisesRegex(RuntimeError, "503"):
+            await self.get_json()
+
+
+if __name__ == "__main__":
+    unittest.main()